@@ -0,0 +1,354 @@
+"""报表系统的ASGI应用（FastAPI），路由与server.py中的ReportSystemHandler一致。
+
+运行: python server.py --workers 4  或  uvicorn asgi_app:app --port 8003 --workers 4
+阻塞的数据库查询、JSON编码和压缩都在有界线程池中执行，不阻塞事件循环。
+"""
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+import server
+
+# 执行阻塞调用的线程数，默认与数据库连接池大小一致
+ASGI_EXECUTOR_THREADS = int(os.getenv('ASGI_EXECUTOR_THREADS', str(server.DB_POOL_MAX)))
+
+executor = ThreadPoolExecutor(max_workers=ASGI_EXECUTOR_THREADS, thread_name_prefix='report')
+
+app = FastAPI(title='报表系统', docs_url=None, redoc_url=None, openapi_url=None)
+
+
+class AdmissionControl:
+    """与ReportSystemHandler.admit相同：耗时接口先占用该类接口的并发名额，等待超时返回503；
+    名额在响应（包括流式响应）发送完毕后才释放"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        name = server.endpoint_class(scope['method'], scope['path']) if scope['type'] == 'http' else None
+        if name is None:
+            await self.app(scope, receive, send)
+            return
+        # 等待名额时不占用执行查询的线程池
+        admitted = await asyncio.get_running_loop().run_in_executor(None, server.endpoint_limiter.acquire, name)
+        if not admitted:
+            response = Response(server.overloaded_body(), 503, {
+                'Content-type': 'application/json; charset=utf-8',
+                'Access-Control-Allow-Origin': '*',
+                'Retry-After': server.RETRY_AFTER,
+            })
+            await response(scope, receive, send)
+            return
+        deadline = None
+        if name in server.ENDPOINT_DEADLINES:
+            # 由单独的任务读取客户端消息并转发给应用，以便在查询执行期间也能发现客户端断开
+            disconnected = threading.Event()
+            deadline = server.RequestDeadline(name, server.ENDPOINT_DEADLINES[name], disconnected.is_set)
+            receive = self.watch_disconnect(receive, disconnected)
+            server.deadline_watchdog.register(deadline)
+        token = server.request_deadline.set(deadline)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            server.request_deadline.reset(token)
+            if deadline is not None:
+                server.deadline_watchdog.unregister(deadline)
+                receive.listener.cancel()
+            server.endpoint_limiter.release(name)
+
+    @staticmethod
+    def watch_disconnect(receive, disconnected):
+        messages = asyncio.Queue()
+
+        async def listen():
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message['type'] == 'http.disconnect':
+                    disconnected.set()
+                    return
+
+        async def forward():
+            return await messages.get()
+
+        forward.listener = asyncio.create_task(listen())
+        return forward
+
+
+class RequestMetrics:
+    """与ReportSystemHandler.measure相同：记录请求耗时、状态码和响应体字节数，包括被限流拒绝的请求"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        label = server.route_label(scope['path'])
+        response = [0, 0]  # 状态码, 响应体字节数
+
+        async def send_and_count(message):
+            if message['type'] == 'http.response.start':
+                response[0] = message['status']
+            elif message['type'] == 'http.response.body':
+                response[1] += len(message.get('body', b''))
+            await send(message)
+
+        server.http_in_flight.inc(1, label)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_and_count)
+        finally:
+            server.http_in_flight.inc(-1, label)
+            server.observe_request(label, scope['method'], response[0], time.perf_counter() - start, response[1])
+
+
+app.add_middleware(AdmissionControl)
+app.add_middleware(RequestMetrics)
+
+
+async def run_blocking(func, *args):
+    """在有界线程池中执行阻塞调用；复制contextvars，使执行查询的线程能取得当前请求的处理时限"""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(executor, context.run, func, *args)
+
+
+def json_error(status, error):
+    return Response(json.dumps(error).encode(), status, {'Access-Control-Allow-Origin': '*'},
+                    media_type='application/json')
+
+
+def json_response(data):
+    return Response(json.dumps(data).encode(), 200, {'Access-Control-Allow-Origin': '*'},
+                    media_type='application/json')
+
+
+async def send_body(request, body, content_type, cache_control='no-cache', headers=None):
+    """与ReportSystemHandler.send_body相同：强ETag、304及按Accept-Encoding压缩"""
+    status, response_headers, body = await run_blocking(
+        server.conditional_body, body, content_type, request.headers.get('If-None-Match'),
+        request.headers.get('Accept-Encoding'), cache_control, headers)
+    return Response(body, status, dict(response_headers))
+
+
+async def send_chunked(chunks, content_type, headers=None):
+    """逐段输出生成器的内容；首段生成后才返回响应，生成出错时仍可返回错误状态。
+    生成器在线程池中推进，加锁保证客户端断开时关闭生成器不会与正在执行的next()冲突"""
+    lock = threading.Lock()
+
+    def step():
+        with lock:
+            return next(chunks, None)
+
+    def close():
+        with lock:
+            chunks.close()
+
+    try:
+        first_chunk = await run_blocking(step)
+    except BaseException:
+        await run_blocking(close)
+        raise
+
+    async def body():
+        try:
+            chunk = first_chunk
+            while chunk is not None:
+                if chunk:
+                    yield chunk
+                chunk = await run_blocking(step)
+        finally:
+            # 提前结束（客户端断开）时关闭生成器，释放服务端游标和数据库连接
+            await run_blocking(close)
+
+    response_headers = {'Content-type': content_type, 'Access-Control-Allow-Origin': '*'}
+    response_headers.update(headers or {})
+    return StreamingResponse(body(), headers=response_headers)
+
+
+async def send_page(request, name):
+    content = await run_blocking(server.static_assets.render_page, name)
+    if content is None:
+        return Response('<h1>404 - 页面未找到</h1>'.encode('utf-8'), 404, {'Content-type': 'text/html; charset=utf-8'})
+    return await send_body(request, content, 'text/html; charset=utf-8')
+
+
+@app.get('/')
+async def index_page(request: Request):
+    return await send_page(request, 'index.html')
+
+
+@app.get('/iqc')
+@app.get('/iqc.html')
+async def iqc_page(request: Request):
+    return await send_page(request, 'iqc.html')
+
+
+@app.get('/recycling')
+@app.get('/recycling.html')
+async def recycling_page(request: Request):
+    return await send_page(request, 'recycling.html')
+
+
+@app.get('/@vite/client')
+async def vite_client():
+    # 处理Vite客户端请求，避免404错误
+    return Response(status_code=204)
+
+
+@app.get('/api/years')
+async def years(request: Request):
+    try:
+        response_data = await run_blocking(server.get_years_bytes)
+    except Exception as e:
+        return json_error(500, {'error': str(e)})
+    return await send_body(request, response_data, 'application/json')
+
+
+@app.post('/api/report')
+async def iqc_report(request: Request):
+    try:
+        data = json.loads((await request.body()).decode())
+        response_data = await run_blocking(server.iqc_report_bytes, data)
+    except TimeoutError as e:
+        return json_error(504, {'error': str(e)})
+    except Exception as e:
+        return json_error(400, {'error': str(e)})
+    # 报表未变化时客户端可带If-None-Match，得到304而无需重新下载
+    return await send_body(request, response_data, 'application/json', headers=server.IQC_REPORT_HEADERS)
+
+
+@app.post('/api/recycling/report')
+async def recycling_report(request: Request):
+    try:
+        report_data = server.mock_recycling_report(json.loads((await request.body()).decode()))
+    except Exception as e:
+        return json_error(400, {'error': str(e)})
+    return Response(json.dumps(report_data).encode(), 200, {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'POST, GET, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type',
+    }, media_type='application/json')
+
+
+@app.get('/api/recycling/export')
+async def recycling_export(request: Request):
+    try:
+        chunks, content_type, headers = server.recycling_export_response(parse_qs(request.url.query))
+        return await send_chunked(chunks, content_type, headers)
+    except TimeoutError as e:
+        return json_error(504, {'error': str(e)})
+    except Exception as e:
+        print(f"导出失败: {str(e)}")
+        return json_error(400, {'error': str(e)})
+
+
+async def recycling_aggregate(request, get_bytes):
+    try:
+        filters = server.parse_recycling_filters(parse_qs(request.url.query))
+        response_data = await run_blocking(get_bytes, filters)
+    except TimeoutError as e:
+        return json_error(504, {'error': str(e)})
+    except Exception as e:
+        print(f"获取回收版聚合数据失败: {str(e)}")
+        return json_error(400, {'error': str(e)})
+    return await send_body(request, response_data, 'application/json; charset=utf-8')
+
+
+@app.get('/api/recycling/summary')
+async def recycling_summary(request: Request):
+    return await recycling_aggregate(request, server.get_recycling_summary_bytes)
+
+
+@app.get('/api/recycling/facets')
+async def recycling_facets(request: Request):
+    return await recycling_aggregate(request, server.get_recycling_facets_bytes)
+
+
+@app.get('/api/recycling')
+@app.get('/api/recycling/{rest:path}')
+async def recycling(request: Request):
+    """与旧服务一致，/api/recycling下除export/summary/facets外的路径（页面使用/api/recycling/data）都返回明细数据"""
+    try:
+        chunks, encoded_data = await run_blocking(server.recycling_api_response, parse_qs(request.url.query))
+        if chunks is not None:
+            return await send_chunked(chunks, 'application/json; charset=utf-8')
+    except TimeoutError as e:
+        return json_error(504, {'error': str(e)})
+    except Exception as e:
+        print(f"处理请求时发生错误: {str(e)}")
+        return json_error(400, {'error': str(e)})
+    return await send_body(request, encoded_data, 'application/json; charset=utf-8',
+                           headers=server.RECYCLING_API_HEADERS)
+
+
+@app.get('/api/cache/stats')
+async def cache_stats():
+    return json_response(server.cache_stats())
+
+
+@app.get('/metrics')
+async def metrics():
+    return Response(server.render_metrics(), 200, {'Content-type': server.METRICS_CONTENT_TYPE})
+
+
+@app.get('/api/warmer/status')
+async def warmer_status():
+    return json_response(server.report_warmer.stats())
+
+
+@app.get('/api/db-test')
+async def db_test():
+    try:
+        return json_response(await run_blocking(server.db_test_result))
+    except Exception as e:
+        return json_error(500, {'status': 'error', 'message': str(e)})
+
+
+@app.options('/{path:path}')
+async def preflight():
+    """处理预检请求"""
+    return Response(status_code=200, headers={
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, If-None-Match',
+    })
+
+
+@app.api_route('/{path:path}', methods=['GET', 'HEAD'])
+async def static_file(request: Request, path: str):
+    """程序目录下的静态文件；/assets/<指纹>/<文件名>在指纹与当前内容一致时可被浏览器永久缓存"""
+    asset, cache_control = await run_blocking(server.static_assets.resolve, request.url.path)
+    if asset is None:
+        return Response('<h1>404 - File not found</h1>'.encode(), 404, {'Content-type': 'text/html;charset=utf-8'})
+    status, headers, body = await run_blocking(
+        server.asset_response, asset, cache_control, request.headers.get('If-None-Match'),
+        request.headers.get('Accept-Encoding'))
+    if body is None:
+        # 大文件未压缩时直接从文件发送
+        return FileResponse(asset['path'], status, dict(headers))
+    return Response(body, status, dict(headers))
+
+
+@app.on_event('startup')
+async def start_warmer():
+    if server.report_warmer.interval > 0:
+        server.report_warmer.start()
+    server.metric_shards.start()
+
+
+@app.on_event('shutdown')
+async def stop_workers():
+    server.report_warmer.stop()
+    server.metric_shards.stop()
+    executor.shutdown(wait=False, cancel_futures=True)
+    server.db_pool.close()
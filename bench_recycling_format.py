@@ -0,0 +1,77 @@
+import gzip
+import json
+import sys
+import time
+from psycopg2.extras import RealDictCursor
+
+from server import build_recycling_query, get_db_connection, recycling_row, to_columnar
+
+
+def from_columnar(columnar):
+    """按recycling.html的解码方式把列式格式还原为行"""
+    rows = []
+    for i in range(columnar['count']):
+        row = {}
+        for field in columnar['fields']:
+            if field in columnar['constants']:
+                row[field] = columnar['constants'][field]
+            elif field in columnar['dictionaries']:
+                row[field] = columnar['dictionaries'][field][columnar['columns'][field][i]]
+            else:
+                row[field] = columnar['columns'][field][i]
+        rows.append(row)
+    return rows
+
+
+def best_time(fn, runs):
+    best = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+# 用法: python bench_recycling_format.py 2024 2025 [--runs 5]
+args = sys.argv[1:]
+runs = 5
+if '--runs' in args:
+    index = args.index('--runs')
+    runs = int(args[index + 1])
+    del args[index:index + 2]
+years = [int(arg) for arg in args] or [2025]
+
+conn = get_db_connection()
+if not conn:
+    sys.exit('数据库连接失败')
+
+failed = False
+cur = conn.cursor(cursor_factory=RealDictCursor)
+for year in years:
+    filters = {'year': year}
+    sql, params = build_recycling_query(filters)
+    cur.execute(sql, params)
+    data = [recycling_row(dict(row)) for row in cur.fetchall()]
+    report_data = {'data': data, 'total': len(data), 'filters': filters}
+
+    # 编码：与get_recycling_bytes相同的json.dumps；列式格式包含转换时间
+    encode = lambda value: json.dumps(value, ensure_ascii=False, default=str).encode('utf-8')
+    rows_body, rows_encode = best_time(lambda: encode(report_data), runs)
+    columnar_body, columnar_encode = best_time(lambda: encode(to_columnar(report_data)), runs)
+    # 解码：解析JSON并得到行数据，列式格式包含还原为行的时间
+    decoded_rows, rows_decode = best_time(lambda: json.loads(rows_body)['data'], runs)
+    decoded_columnar, columnar_decode = best_time(lambda: from_columnar(json.loads(columnar_body)), runs)
+
+    print(f'{year}年 ({len(data)} 行):')
+    print(f'  行格式:  {len(rows_body):>9} 字节 (gzip {len(gzip.compress(rows_body)):>7}), '
+          f'编码 {rows_encode * 1000:.2f}ms, 解码 {rows_decode * 1000:.2f}ms')
+    print(f'  列式格式: {len(columnar_body):>9} 字节 (gzip {len(gzip.compress(columnar_body)):>7}), '
+          f'编码 {columnar_encode * 1000:.2f}ms, 解码 {columnar_decode * 1000:.2f}ms, '
+          f'大小为行格式的 {len(columnar_body) / len(rows_body):.0%}')
+    if decoded_columnar != decoded_rows:
+        failed = True
+        print('  还原后的行与行格式不一致')
+conn.close()
+
+sys.exit(1 if failed else 0)
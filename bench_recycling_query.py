@@ -0,0 +1,154 @@
+import sys
+import time
+from psycopg2.extras import RealDictCursor
+
+from server import build_recycling_query, get_db_connection
+
+# 改写前的回收版查询（机台、上片时间、htm_no、缺陷数均为重复的相关子查询），用于对比输出和速度
+LEGACY_RECYCLING_SQL = """
+    SELECT 
+        l.customer_name,
+        l.lot_name,
+        l.model_id,
+        (CASE 
+            WHEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') <> '' 
+             AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') <> '' 
+            THEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') || '/' || (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022')
+            WHEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') <> '' 
+            THEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020')
+            WHEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') <> '' 
+            THEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022')
+            ELSE NULL 
+         END) AS equipment,
+        l.cd,
+        l.process_layer,
+        (CASE 
+        WHEN ((SELECT htm_no from erp_cam_design_param ecdp where ecdp.lot_name = l.lot_name order by ecdp.htm_no desc limit 1) = 2 )
+        THEN CONCAT(
+            TO_CHAR((SELECT event_time FROM lot_history lh WHERE lh.lot_name = l.lot_name AND lh.process_seq_name = 'A2020' and lh.lot_process_state = 'Run' order by lh.event_time limit 1), 'YYYY-MM-DD HH24:MI:SS'),
+            ';',
+            TO_CHAR((SELECT event_time FROM lot_history lh WHERE lh.lot_name = l.lot_name AND lh.process_seq_name = 'A2022' and lh.lot_process_state = 'Run' order by lh.event_time limit 1), 'YYYY-MM-DD HH24:MI:SS')
+        )
+        ELSE TO_CHAR((SELECT event_time FROM lot_history lh WHERE lh.lot_name = l.lot_name AND lh.process_seq_name = 'A2020' and lh.lot_process_state = 'Run' order by lh.event_time limit 1), 'YYYY-MM-DD HH24:MI:SS')
+     END) AS locktime,
+        l.material_id,
+        cd.vendor,
+        l.lot_type,
+        l.product_size as product_size,
+				(CASE 
+		WHEN ((SELECT htm_no FROM erp_cam_design_param ecdp WHERE ecdp.lot_name = l.lot_name ORDER BY ecdp.htm_no DESC LIMIT 1) = 2)
+		THEN 
+   		 (SELECT count(aafi.sno)::text 
+   	 	 FROM analyze_aoi_field_item aafi 
+    	 LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
+    	 WHERE aafi.kind IN ('A1','A2','A3','A4') 
+    	   AND aaf.process_flow_seq_name = 'C4010' 
+    	   AND l.lot_name = aaf.order_no)
+  	  || ';' || 
+  	  (SELECT count(aafi.sno)::text 
+    	 FROM analyze_aoi_field_item aafi 
+   	  LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
+   	  WHERE aafi.kind IN ('A1','A2','A3','A4') 
+    	   AND aaf.process_flow_seq_name = 'C4017' 
+    	   AND l.lot_name = aaf.order_no)
+       		 ELSE 
+    (SELECT count(aafi.sno)::text 
+     FROM analyze_aoi_field_item aafi 
+     LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
+     WHERE aafi.kind IN ('A1','A2','A3','A4') 
+       AND aaf.process_flow_seq_name = 'C4010' 
+       AND l.lot_name = aaf.order_no)
+    		END) AS black,
+    	(CASE 
+		WHEN ((SELECT htm_no FROM erp_cam_design_param ecdp WHERE ecdp.lot_name = l.lot_name ORDER BY ecdp.htm_no DESC LIMIT 1) = 2)
+		THEN 
+   		 (SELECT count(aafi.sno)::text 
+   	 	 FROM analyze_aoi_field_item aafi 
+    	 LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
+    	 WHERE aafi.kind IN ('B1','B2','B3','B4') 
+    	   AND aaf.process_flow_seq_name = 'C4010' 
+    	   AND l.lot_name = aaf.order_no)
+  	  || ';' || 
+  	  (SELECT count(aafi.sno)::text 
+    	 FROM analyze_aoi_field_item aafi 
+   	  LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
+   	  WHERE aafi.kind IN ('B1','B2','B3','B4') 
+    	   AND aaf.process_flow_seq_name = 'C4017' 
+    	   AND l.lot_name = aaf.order_no)
+       		 ELSE 
+    (SELECT count(aafi.sno)::text 
+     FROM analyze_aoi_field_item aafi 
+     LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
+     WHERE aafi.kind IN ('B1','B2','B3','B4') 
+       AND aaf.process_flow_seq_name = 'C4010' 
+       AND l.lot_name = aaf.order_no)
+    		END)  AS white,
+        l.event_time as repairtime,
+        l.product_type
+    FROM 
+        lot l 
+        INNER JOIN consumable_def cd ON l.material_def_id = cd.consumable_def_name
+    WHERE 
+        cd.description LIKE 'R%%'
+        AND cd.consumable_type = '主原材料'
+        AND l.material_id IS NOT NULL
+        AND l.lot_name IS NOT NULL
+        AND l.lot_name != ''
+        AND l.event_time >= %s AND l.event_time < %s
+    ORDER BY locktime desc
+"""
+
+
+def fetch_rows(cur, sql, params):
+    """执行查询，返回(排序后的结果, 耗时秒)"""
+    started = time.perf_counter()
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    elapsed = time.perf_counter() - started
+    # locktime相同的行顺序不确定，按lot_name排序后再比较
+    rows = sorted((dict(row) for row in rows), key=lambda row: (row['locktime'] or '', row['lot_name']))
+    return rows, elapsed
+
+
+def best_of(cur, sql, params, runs):
+    rows, best = fetch_rows(cur, sql, params)
+    for _ in range(runs - 1):
+        best = min(best, fetch_rows(cur, sql, params)[1])
+    return rows, best
+
+
+# 用法: python bench_recycling_query.py 2024 2025 [--runs 5]
+args = sys.argv[1:]
+runs = 5
+if '--runs' in args:
+    index = args.index('--runs')
+    runs = int(args[index + 1])
+    del args[index:index + 2]
+years = [int(arg) for arg in args] or [2025]
+
+conn = get_db_connection()
+if not conn:
+    sys.exit('数据库连接失败')
+
+failed = False
+cur = conn.cursor(cursor_factory=RealDictCursor)
+for year in years:
+    new_sql, params = build_recycling_query({'year': year})
+    legacy_rows, legacy_time = best_of(cur, LEGACY_RECYCLING_SQL, params, runs)
+    new_rows, new_time = best_of(cur, new_sql, params, runs)
+    count = len(new_rows)
+    print(f'{year}年: 旧查询 {legacy_time * 1000:.1f}ms ({count / legacy_time if legacy_time else 0:.0f} 行/秒), '
+          f'新查询 {new_time * 1000:.1f}ms ({count / new_time if new_time else 0:.0f} 行/秒), '
+          f'加速 {legacy_time / new_time if new_time else 0:.1f}x')
+    if legacy_rows == new_rows:
+        print(f'  输出一致 ({count} 行)')
+    else:
+        failed = True
+        print(f'  输出不一致 (旧查询 {len(legacy_rows)} 行, 新查询 {count} 行)')
+        for old, new in zip(legacy_rows, new_rows):
+            if old != new:
+                print(f'  旧: {old}')
+                print(f'  新: {new}')
+conn.close()
+
+sys.exit(1 if failed else 0)
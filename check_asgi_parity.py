@@ -0,0 +1,97 @@
+import sys
+import gzip
+import json
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+# 对比旧服务(python server.py --legacy)与ASGI服务(python server.py)对相同请求的响应：
+# 状态码、关键响应头和响应体需一致
+COMPARED_HEADERS = ('content-type', 'etag', 'cache-control', 'content-encoding', 'vary',
+                    'access-control-allow-origin', 'access-control-expose-headers', 'content-disposition')
+
+# (方法, 路径, 请求体, 附加请求头)
+CASES = [
+    ('GET', '/', None, {}),
+    ('GET', '/iqc.html', None, {}),
+    ('GET', '/recycling', None, {}),
+    ('GET', '/recycling.html', None, {'Accept-Encoding': 'gzip'}),
+    ('GET', '/vue.global.js', None, {'Accept-Encoding': 'gzip'}),
+    ('GET', '/chart.min.js', None, {}),
+    ('GET', '/.env', None, {}),
+    ('GET', '/server.py', None, {}),
+    ('HEAD', '/vue.global.js', None, {}),
+    ('GET', '/api/years', None, {}),
+    ('GET', '/api/recycling?year=2025', None, {}),
+    ('GET', '/api/recycling?year=2025&limit=7&total=1', None, {}),
+    ('GET', '/api/recycling?year=2025&format=columnar', None, {'Accept-Encoding': 'gzip'}),
+    ('GET', '/api/recycling?year=2025&stream=1', None, {}),
+    ('GET', '/api/recycling/data?year=2025&limit=50&total=1&format=columnar', None, {'Accept-Encoding': 'gzip'}),
+    ('GET', '/api/recycling?year=2025&format=xml', None, {}),
+    ('GET', '/api/recycling/summary?year=2025', None, {}),
+    ('GET', '/api/recycling/facets?year=2025&supplier=SKE', None, {}),
+    ('GET', '/api/recycling/export?year=2025&format=csv', None, {}),
+    ('GET', '/api/recycling/export?format=pdf', None, {}),
+    ('POST', '/api/report', {'year': 2025}, {}),
+    ('POST', '/api/report', {'years': [2024, 2025], 'material_type': 'quartz'}, {}),
+    ('POST', '/api/report', {'start': '2024-03-01', 'end': '2025-02-28'}, {'Accept-Encoding': 'gzip'}),
+    ('OPTIONS', '/api/report', None, {}),
+]
+
+# 不对外提供的文件：两边的GET和HEAD都必须返回404
+PRIVATE_PATHS = ('/.env', '/server.py', '/asgi_app.py')
+
+
+def fetch(base, method, path, body, headers):
+    data = json.dumps(body).encode() if body is not None else None
+    request = Request(base + path, data=data, method=method, headers={'Content-Type': 'application/json', **headers})
+    try:
+        with urlopen(request, timeout=300) as response:
+            return response.status, response.headers, response.read()
+    except HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def summarize(status, headers, body):
+    selected = {name: headers.get(name) for name in COMPARED_HEADERS if headers.get(name) is not None}
+    # gzip头部含压缩时间，比较解压后的内容
+    if headers.get('content-encoding') == 'gzip':
+        body = gzip.decompress(body)
+    # 错误响应只比较状态码
+    return status, selected, body if status < 400 else b''
+
+
+# 用法: python check_asgi_parity.py http://localhost:8003 http://localhost:8004
+legacy_base = sys.argv[1] if len(sys.argv) > 1 else 'http://localhost:8003'
+asgi_base = sys.argv[2] if len(sys.argv) > 2 else 'http://localhost:8004'
+
+failed = False
+for method, path, body, headers in CASES:
+    legacy = summarize(*fetch(legacy_base, method, path, body, headers))
+    asgi = summarize(*fetch(asgi_base, method, path, body, headers))
+    # 带上ETag再请求一次，两边都应返回304
+    cases = [(legacy, asgi)]
+    etag = legacy[1].get('etag')
+    if legacy[0] == 200 and etag:
+        conditional = {**headers, 'If-None-Match': etag}
+        cases.append((summarize(*fetch(legacy_base, method, path, body, conditional))[:2],
+                      summarize(*fetch(asgi_base, method, path, body, conditional))[:2]))
+    for old, new in cases:
+        if old == new:
+            continue
+        failed = True
+        print(f'{method} {path}: 不一致')
+        print(f'  旧: {old[0]} {old[1]} {len(old[2]) if len(old) > 2 else ""}')
+        print(f'  新: {new[0]} {new[1]} {len(new[2]) if len(new) > 2 else ""}')
+        break
+    else:
+        print(f'{method} {path}: 一致 ({legacy[0]}, {len(legacy[2])} 字节)')
+
+for path in PRIVATE_PATHS:
+    for base in (legacy_base, asgi_base):
+        for method in ('GET', 'HEAD'):
+            status = fetch(base, method, path, None, {})[0]
+            if status != 404:
+                failed = True
+                print(f'{method} {base}{path}: 返回{status}，应为404')
+
+sys.exit(1 if failed else 0)
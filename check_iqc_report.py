@@ -0,0 +1,77 @@
+import sys
+from psycopg2.extras import RealDictCursor
+
+from server import IQC_REPORT_SQL, get_db_connection, period_params, year_range
+
+# 改写前的IQC报表查询（每个lot执行两次相关子查询），用于回归对比
+LEGACY_IQC_REPORT_SQL = """
+    SELECT
+        DATE_TRUNC('month', l.event_time) AS month,
+        CASE WHEN cd.vendor IS NULL THEN 'Unknown' ELSE cd.vendor END AS vendor,
+        CASE
+            WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '02' THEN 'Quartz'
+            WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '01' THEN 'Soda'
+            ELSE 'Other'
+        END AS material_type,
+        COUNT(l.lot_name) AS shipped_lot_count,
+        ROUND(AVG(
+            (SELECT COUNT(aafi.sno)::float
+             FROM analyze_aoi_field_item aafi
+             LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id
+             WHERE aafi.kind IN ('A1','A2','A3','A4')
+             AND aaf.process_flow_seq_name = 'C4010'
+             AND aaf.order_no = l.lot_name)
+        )::numeric, 3) AS avg_black,
+        ROUND(AVG(
+            (SELECT COUNT(aafi.sno)::float
+             FROM analyze_aoi_field_item aafi
+             LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id
+             WHERE aafi.kind IN ('B1','B2','B3','B4')
+             AND aaf.process_flow_seq_name = 'C4010'
+             AND aaf.order_no = l.lot_name)
+        )::numeric, 3) AS avg_white
+    FROM lot l
+    LEFT JOIN consumable_def cd ON l.material_def_id = cd.consumable_def_name
+    WHERE l.lot_state = 'Shipped'
+        AND EXTRACT(YEAR FROM l.event_time) = %s
+    GROUP BY DATE_TRUNC('month', l.event_time), CASE WHEN cd.vendor IS NULL THEN 'Unknown' ELSE cd.vendor END,
+             CASE
+                 WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '02' THEN 'Quartz'
+                 WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '01' THEN 'Soda'
+                 ELSE 'Other'
+             END;
+"""
+
+
+def fetch_rows(cur, sql, params):
+    cur.execute(sql, params)
+    # 只比较旧查询中存在的列
+    legacy_columns = ('month', 'vendor', 'material_type', 'shipped_lot_count', 'avg_black', 'avg_white')
+    rows = [{key: row[key] for key in legacy_columns} for row in cur.fetchall()]
+    return sorted(rows, key=lambda row: (row['month'], row['vendor'], row['material_type']))
+
+
+# 用法: python check_iqc_report.py 2024 2025
+years = [int(arg) for arg in sys.argv[1:]] or [2025]
+
+conn = get_db_connection()
+if not conn:
+    sys.exit('数据库连接失败')
+
+failed = False
+cur = conn.cursor(cursor_factory=RealDictCursor)
+for year in years:
+    legacy_rows = fetch_rows(cur, LEGACY_IQC_REPORT_SQL, (year,))
+    new_rows = fetch_rows(cur, IQC_REPORT_SQL, period_params([year_range(year)]))
+    if legacy_rows == new_rows:
+        print(f'{year}年: 一致 ({len(new_rows)} 行)')
+    else:
+        failed = True
+        print(f'{year}年: 不一致 (旧查询 {len(legacy_rows)} 行, 新查询 {len(new_rows)} 行)')
+        for old, new in zip(legacy_rows, new_rows):
+            if old != new:
+                print(f'  旧: {old}')
+                print(f'  新: {new}')
+conn.close()
+
+sys.exit(1 if failed else 0)
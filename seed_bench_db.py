@@ -0,0 +1,95 @@
+import sys
+import random
+from datetime import datetime, timedelta
+
+from server import get_db_connection
+
+# 为bench_recycling_query.py / check_iqc_report.py准备本地测试库：建表并写入随机但可复现的数据。
+# 只包含报表查询用到的表和列；覆盖无供应商、非回收版物料、空机台、多次Run记录、
+# 无htm_no记录及htm_no为NULL的lot等情况
+SCHEMA_SQL = """
+    DROP TABLE IF EXISTS lot, consumable_def, analyze_aoi_field, analyze_aoi_field_item,
+        lot_engineer_setting, lot_history, erp_cam_design_param;
+    CREATE TABLE consumable_def(consumable_def_name text PRIMARY KEY, vendor text, description text, consumable_type text);
+    CREATE TABLE lot(lot_name text, lot_state text, event_time timestamp, material_def_id text, customer_name text,
+        model_id text, cd text, process_layer text, material_id text, lot_type text, product_size numeric, product_type text);
+    CREATE TABLE analyze_aoi_field(id serial PRIMARY KEY, order_no text, process_flow_seq_name text);
+    CREATE TABLE analyze_aoi_field_item(sno serial PRIMARY KEY, af_id int, kind text);
+    CREATE TABLE lot_engineer_setting(lot_name text, process_seq_name text, equipment_name text);
+    CREATE TABLE lot_history(lot_name text, process_seq_name text, lot_process_state text, event_time timestamp);
+    CREATE TABLE erp_cam_design_param(lot_name text, htm_no int);
+"""
+
+SEED_TABLES = ('lot', 'consumable_def', 'analyze_aoi_field', 'analyze_aoi_field_item',
+               'lot_engineer_setting', 'lot_history', 'erp_cam_design_param')
+AOI_KINDS = ['A1', 'A2', 'A3', 'A4', 'B1', 'B2', 'B3', 'B4', 'C1']
+
+
+def seed(cur, lots, first_year, years, rng):
+    cur.execute(SCHEMA_SQL)
+    # 物料定义：材料代码01/02/03对应Soda/Quartz/Other，部分不是回收版或不是主原材料
+    material_defs = []
+    for i, vendor in enumerate(['ULC', 'HOYA', 'SKE', None]):
+        for code in ['01', '02', '03']:
+            name = f'MAT{code}{i}'
+            material_defs.append(name)
+            cur.execute("INSERT INTO consumable_def VALUES (%s, %s, %s, %s)",
+                        (name, vendor, rng.choice(['R-glass', 'Rx', 'New']), rng.choice(['主原材料', '主原材料', '辅料'])))
+
+    start = datetime(first_year, 1, 1)
+    minutes = (datetime(first_year + years, 1, 1) - start) // timedelta(minutes=1)
+    for n in range(lots):
+        lot = f'L{n:05d}'
+        event_time = start + timedelta(minutes=rng.randrange(minutes))
+        cur.execute("INSERT INTO lot VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)", (
+            lot, rng.choice(['Shipped', 'Shipped', 'Shipped', 'Run']), event_time, rng.choice(material_defs + ['NOPE']),
+            rng.choice(['CustA', 'CustB', 'CustC', None]), f'M{rng.randint(1, 5)}', str(rng.randint(1, 9)),
+            rng.choice(['L1', 'L2']), rng.choice([f'B{n % 50:03d}', None, f'B{n % 50:03d}']), rng.choice(['P', 'E', 'R']),
+            rng.choice([5, 6, 7, None]), 'PT'))
+        for station in rng.sample(['C4010', 'C4017', 'C4010', 'X'], rng.randint(0, 3)):
+            cur.execute("INSERT INTO analyze_aoi_field(order_no, process_flow_seq_name) VALUES (%s, %s) RETURNING id",
+                        (lot, station))
+            af_id = cur.fetchone()[0]
+            for _ in range(rng.randint(0, 6)):
+                cur.execute("INSERT INTO analyze_aoi_field_item(af_id, kind) VALUES (%s, %s)", (af_id, rng.choice(AOI_KINDS)))
+        for station in ['A2020', 'A2022']:
+            if rng.random() < 0.7:
+                cur.execute("INSERT INTO lot_engineer_setting VALUES (%s, %s, %s)",
+                            (lot, station, rng.choice(['EQ1', 'EQ2', '', None])))
+            for _ in range(rng.randint(0, 2)):
+                cur.execute("INSERT INTO lot_history VALUES (%s, %s, %s, %s)", (
+                    lot, station, rng.choice(['Run', 'Wait']), event_time - timedelta(hours=rng.randint(1, 100))))
+        # 无记录、单条或多条htm_no，其中可能有NULL（降序排序时NULL在最前）
+        for htm_no in rng.sample([1, 2, None], rng.randint(0, 2)):
+            cur.execute("INSERT INTO erp_cam_design_param VALUES (%s, %s)", (lot, htm_no))
+    cur.execute("ANALYZE")
+
+
+# 用法: python seed_bench_db.py [--lots 3000] [--first-year 2022] [--years 4] [--seed 7] [--drop]
+# 会删除并重建上述表，库中已有这些表时必须指定--drop；只应在本地测试库(DB_NAME)上运行
+args = sys.argv[1:]
+options = {'--lots': 3000, '--first-year': 2022, '--years': 4, '--seed': 7}
+for name in options:
+    if name in args:
+        index = args.index(name)
+        options[name] = int(args[index + 1])
+        del args[index:index + 2]
+drop = '--drop' in args
+
+conn = get_db_connection()
+if not conn:
+    sys.exit('数据库连接失败')
+conn.autocommit = True
+cur = conn.cursor()
+cur.execute("SELECT relname FROM pg_class WHERE relname = ANY(%s) AND relkind = 'r' AND pg_table_is_visible(oid)",
+            (list(SEED_TABLES),))
+existing = [name for (name,) in cur.fetchall()]
+if existing and not drop:
+    sys.exit(f"库中已有表 {', '.join(existing)}，确认是测试库后加--drop重建")
+
+seed(cur, options['--lots'], options['--first-year'], options['--years'], random.Random(options['--seed']))
+cur.execute("SELECT COUNT(*), COUNT(*) FILTER (WHERE htm_no IS NULL) FROM erp_cam_design_param")
+params, null_htm = cur.fetchone()
+print(f"已写入 {options['--lots']} 个lot（{options['--first-year']}-{options['--first-year'] + options['--years'] - 1}年），"
+      f"{params} 条htm_no记录（其中NULL {null_htm} 条）")
+conn.close()
@@ -1,57 +1,2605 @@
 import http.server
 import socketserver
-from socketserver import ThreadingMixIn
+import base64
+import bisect
+import csv
+import fcntl
+import gzip
+import hashlib
 import json
+import mimetypes
 import random
 import os
-from io import BytesIO
-from urllib.parse import urlparse
+import queue
+import select
+import signal
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+import contextvars
+from decimal import Decimal, ROUND_HALF_UP
+from io import StringIO
+from urllib.parse import quote, urlparse
 from datetime import datetime, timedelta
+import openpyxl
 import psycopg2
+import psycopg2.pool
 from psycopg2.extras import RealDictCursor
+import numpy as np
+import pandas as pd
 from dotenv import load_dotenv
 
+try:
+    import brotli  # 可选依赖，未安装时只使用gzip
+except ImportError:
+    brotli = None
+
 # Load environment variables
 load_dotenv()
 
-# Database connection configuration
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'port': os.getenv('DB_PORT', '5432'),
-    'database': os.getenv('DB_NAME', 'report_system'),
-    'user': os.getenv('DB_USER', 'postgres'),
-    'password': os.getenv('DB_PASSWORD', 'your_password')
-}
+# Database connection configuration
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'localhost'),
+    'port': os.getenv('DB_PORT', '5432'),
+    'database': os.getenv('DB_NAME', 'report_system'),
+    'user': os.getenv('DB_USER', 'postgres'),
+    'password': os.getenv('DB_PASSWORD', 'your_password')
+}
+
+# 报表缓存及本地月度汇总库所在目录
+REPORT_CACHE_DIR = os.getenv('REPORT_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.report_cache'))
+
+# Database connection function
+def get_db_connection():
+    """单独建立一个数据库连接（供独立脚本使用，服务内的查询统一使用db_pool）"""
+    try:
+        conn = psycopg2.connect(**DB_CONFIG)
+        return conn
+    except Exception as e:
+        print(f"Database connection failed: {e}")
+        return None
+
+# 连接池配置：启动时建立并常驻的空闲连接数（超出部分归还时关闭）、最多同时借出的连接数、
+# 等待空闲连接的超时时间（秒）、连接空闲超过多少秒后借出前先检查是否可用
+DB_POOL_MIN = int(os.getenv('DB_POOL_MIN', '4'))
+DB_POOL_MAX = int(os.getenv('DB_POOL_MAX', '10'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '10'))
+DB_POOL_CHECK_IDLE = float(os.getenv('DB_POOL_CHECK_IDLE', '30'))
+
+# 每个连接建立时应用的会话参数（libpq options），如 statement_timeout=120000 lock_timeout=5000
+DB_SESSION_SETTINGS = os.getenv('DB_SESSION_SETTINGS', 'statement_timeout=300000 idle_in_transaction_session_timeout=600000')
+DB_APPLICATION_NAME = os.getenv('DB_APPLICATION_NAME', 'report-system')
+
+class PoolTimeout(TimeoutError):
+    """等待空闲数据库连接超时"""
+
+# 各类耗时接口的处理时限（秒，类别见endpoint_class）：借出连接时设置statement_timeout为剩余时间，
+# 并由后台线程每DEADLINE_POLL_INTERVAL秒检查，超时或客户端已断开时用conn.cancel()取消正在执行的查询
+ENDPOINT_DEADLINES = {
+    name: float(seconds)
+    for name, seconds in (item.split('=') for item in os.getenv('ENDPOINT_DEADLINES', 'report=120,recycling=60,export=600,aggregate=60').split(','))
+}
+DEADLINE_POLL_INTERVAL = float(os.getenv('DEADLINE_POLL_INTERVAL', '0.5'))
+
+class QueryTimeout(TimeoutError):
+    """请求超过接口处理时限"""
+
+class ClientDisconnected(Exception):
+    """客户端已断开，查询已取消"""
+
+# 当前请求的RequestDeadline；ASGI模式下随contextvars复制到执行查询的线程
+request_deadline = contextvars.ContextVar('request_deadline', default=None)
+
+class RequestDeadline:
+    """一次请求的截止时间；请求中借出的数据库连接登记在此，超时或客户端断开时取消正在执行的查询"""
+
+    def __init__(self, name, seconds, disconnected=None):
+        self.name = name
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+        self.disconnected = disconnected  # 返回客户端是否已断开的函数
+        self.reason = None  # 'timeout'或'disconnect'
+        self.connections = set()
+        self.lock = threading.Lock()
+
+    def remaining(self):
+        return self.expires - time.monotonic()
+
+    def mark(self, reason):
+        """记录取消原因，只记录第一次"""
+        with self.lock:
+            if self.reason is not None:
+                return
+            self.reason = reason
+        deadline_watchdog.count(self.name, reason)
+
+    def error(self):
+        if self.reason == 'disconnect':
+            return ClientDisconnected('客户端已断开，查询已取消')
+        return QueryTimeout(f"查询超过时限（{self.seconds:g}秒），请缩小筛选范围后重试")
+
+    def attach(self, conn):
+        if self.reason is None and self.remaining() <= 0:
+            self.mark('timeout')
+        with self.lock:
+            if self.reason is None:
+                self.connections.add(conn)
+                return
+        raise self.error()
+
+    def detach(self, conn):
+        with self.lock:
+            self.connections.discard(conn)
+
+    def check(self):
+        """超过时限或客户端已断开时取消登记的连接上正在执行的查询"""
+        if self.reason is None:
+            if self.remaining() <= 0:
+                self.mark('timeout')
+            elif self.disconnected is not None and self.disconnected():
+                self.mark('disconnect')
+            else:
+                return
+        with self.lock:
+            connections, self.connections = self.connections, set()
+        for conn in connections:
+            try:
+                conn.cancel()
+            except psycopg2.Error:
+                pass
+
+class DeadlineWatchdog:
+    """后台线程：定期检查所有处理中请求的截止时间和客户端连接；统计各类接口超时和因断开取消的次数"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.active = set()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.timeouts = {}
+        self.disconnects = {}
+
+    def register(self, deadline):
+        with self.lock:
+            self.active.add(deadline)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True, name='deadline-watchdog')
+                self.thread.start()
+
+    def unregister(self, deadline):
+        with self.lock:
+            self.active.discard(deadline)
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            with self.lock:
+                deadlines = list(self.active)
+            for deadline in deadlines:
+                deadline.check()
+
+    def count(self, name, reason):
+        with self.lock:
+            counter = self.timeouts if reason == 'timeout' else self.disconnects
+            counter[name] = counter.get(name, 0) + 1
+
+    def stats(self):
+        with self.lock:
+            return {'active': len(self.active), 'timeouts': dict(self.timeouts), 'disconnects': dict(self.disconnects)}
+
+deadline_watchdog = DeadlineWatchdog(DEADLINE_POLL_INTERVAL)
+
+class PooledConnection(psycopg2.extensions.connection):
+    """连接池中的连接，记录最近一次归还的时间，用于判断借出前是否需要检查"""
+    last_used = 0.0
+
+class ConnectionPool:
+    """线程安全的PostgreSQL连接池：第一次使用时创建，借出时最多等待timeout秒，
+    空闲较久的连接借出前执行SELECT 1检查，失效连接直接丢弃并重新借出"""
+
+    def __init__(self, config, minconn, maxconn, timeout, check_idle):
+        self.config = dict(config)
+        self.config['application_name'] = DB_APPLICATION_NAME
+        if DB_SESSION_SETTINGS.strip():
+            self.config['options'] = ' '.join(f'-c {item}' for item in DB_SESSION_SETTINGS.split())
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.check_idle = check_idle
+        self.pool = None
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(maxconn)
+        self.checkouts = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.timeouts = 0
+        self.discarded = 0
+        self.health_checks = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def get_pool(self):
+        with self.lock:
+            if self.pool is None:
+                self.pool = psycopg2.pool.ThreadedConnectionPool(
+                    self.minconn, self.maxconn, connection_factory=PooledConnection, **self.config)
+            return self.pool
+
+    def healthy(self, conn):
+        """借出前检查连接：已关闭的连接直接判为失效，空闲超过check_idle秒的执行一次SELECT 1"""
+        if conn.closed:
+            return False
+        if time.time() - conn.last_used < self.check_idle:
+            return True
+        with self.lock:
+            self.health_checks += 1
+        try:
+            with conn.cursor() as cur:
+                cur.execute('SELECT 1')
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self, deadline=None):
+        """借出一个连接，超时未等到空闲连接时抛出PoolTimeout；等待时间不超过请求的剩余时限"""
+        timeout = self.timeout if deadline is None else max(min(self.timeout, deadline.remaining()), 0)
+        start = time.time()
+        with self.lock:
+            self.waiting += 1
+        acquired = self.slots.acquire(timeout=timeout)
+        waited = time.time() - start
+        with self.lock:
+            self.waiting -= 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            if not acquired:
+                self.timeouts += 1
+        if not acquired:
+            raise PoolTimeout(f"等待数据库连接超时（{timeout:g}秒）")
+        try:
+            pool = self.get_pool()
+            while True:
+                conn = pool.getconn()
+                if self.healthy(conn):
+                    break
+                with self.lock:
+                    self.discarded += 1
+                pool.putconn(conn, close=True)
+        except Exception:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.checkouts += 1
+            self.in_use += 1
+        return conn
+
+    def putconn(self, conn):
+        """归还连接：未结束的事务回滚、恢复非自动提交，出错或已断开的连接关闭后丢弃"""
+        close = bool(conn.closed)
+        if not close:
+            try:
+                conn.rollback()
+                conn.autocommit = False
+            except psycopg2.Error:
+                close = True
+        conn.last_used = time.time()
+        try:
+            self.pool.putconn(conn, close=close)
+        finally:
+            with self.lock:
+                self.in_use -= 1
+                if close:
+                    self.discarded += 1
+            self.slots.release()
+
+    @contextmanager
+    def connection(self):
+        """with db_pool.connection() as conn: ... 借出连接，退出时自动归还。
+        在有处理时限的请求中，本次事务的statement_timeout设为剩余时间，超时或客户端断开时查询被取消"""
+        deadline = request_deadline.get()
+        conn = self.getconn(deadline)
+        try:
+            if deadline is not None:
+                deadline.attach(conn)
+                with conn.cursor() as cur:
+                    cur.execute("SELECT set_config('statement_timeout', %s, true)",
+                                (str(max(int(deadline.remaining() * 1000), 1)),))
+            yield conn
+        except psycopg2.extensions.QueryCanceledError as e:
+            if deadline is None:
+                raise
+            deadline.mark('timeout')  # statement_timeout先于后台检查触发
+            raise deadline.error() from e
+        finally:
+            if deadline is not None:
+                deadline.detach(conn)
+            self.putconn(conn)
+
+    def stats(self):
+        with self.lock:
+            pool = self.pool
+            return {
+                'min': self.minconn,
+                'max': self.maxconn,
+                'open': len(pool._pool) + len(pool._used) if pool else 0,
+                'in_use': self.in_use,
+                'waiting': self.waiting,
+                'checkouts': self.checkouts,
+                'timeouts': self.timeouts,
+                'discarded': self.discarded,
+                'health_checks': self.health_checks,
+                'avg_wait_ms': round(self.wait_total / (self.checkouts + self.timeouts) * 1000, 3) if self.checkouts + self.timeouts else 0,
+                'max_wait_ms': round(self.wait_max * 1000, 3),
+            }
+
+    def close(self):
+        with self.lock:
+            if self.pool is not None:
+                self.pool.closeall()
+                self.pool = None
+
+db_pool = ConnectionPool(DB_CONFIG, DB_POOL_MIN, DB_POOL_MAX, DB_POOL_TIMEOUT, DB_POOL_CHECK_IDLE)
+
+# /metrics延迟直方图的桶上限（秒），逗号分隔
+METRIC_BUCKETS = tuple(float(bound) for bound in os.getenv(
+    'METRIC_BUCKETS', '0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10,30,60,120').split(','))
+
+class Metric:
+    """Prometheus指标。每个线程只写自己的分片（标签取值 -> 数值列表），记录时不加锁、不新建容器，
+    导出时再把各分片相加。histogram的数值列表为各桶计数、+Inf桶计数和总和，其余类型只有一个数值"""
+
+    def __init__(self, name, help, kind, labelnames, buckets=None):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.width = len(buckets) + 2 if buckets else 1
+        self.local = threading.local()
+        self.shards = []
+        self.lock = threading.Lock()  # 只在线程第一次记录时登记分片
+
+    def series(self, labels):
+        shard = getattr(self.local, 'shard', None)
+        if shard is None:
+            shard = self.local.shard = {}
+            with self.lock:
+                self.shards.append(shard)
+        values = shard.get(labels)
+        if values is None:
+            values = shard[labels] = [0] * self.width
+        return values
+
+    def inc(self, amount, *labels):
+        self.series(labels)[0] += amount
+
+    def observe(self, value, *labels):
+        values = self.series(labels)
+        values[bisect.bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+    def collect(self):
+        with self.lock:
+            shards = list(self.shards)
+        totals = {}
+        for shard in shards:
+            for labels, values in list(shard.items()):
+                total = totals.setdefault(labels, [0] * self.width)
+                for i, value in enumerate(list(values)):
+                    total[i] += value
+        return totals
+
+    def merge(self, totals, series):
+        """把其他进程快照中的[标签取值, 数值列表]加到totals，桶配置不同的快照忽略"""
+        for labels, values in series:
+            if len(values) != self.width:
+                continue
+            total = totals.setdefault(tuple(labels), [0] * self.width)
+            for i, value in enumerate(values):
+                total[i] += value
+
+    def render(self, lines, totals):
+        lines.append(f'# HELP {self.name} {self.help}')
+        lines.append(f'# TYPE {self.name} {self.kind}')
+        for labels, values in sorted(totals.items()):
+            pairs = metric_pairs(zip(self.labelnames, labels))
+            if self.kind != 'histogram':
+                lines.append(f'{self.name}{metric_labels(pairs)} {values[0]}')
+                continue
+            count = 0
+            for bound, bucket_count in zip(self.buckets + ('+Inf',), values):
+                count += bucket_count
+                le = f'le="{bound}"'
+                lines.append(f'{self.name}_bucket{metric_labels(pairs + [le])} {count}')
+            lines.append(f'{self.name}_sum{metric_labels(pairs)} {values[-1]}')
+            lines.append(f'{self.name}_count{metric_labels(pairs)} {count}')
+
+def metric_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def metric_pairs(items):
+    return [f'{name}="{metric_label(value)}"' for name, value in items]
+
+def metric_labels(pairs):
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+http_request_seconds = Metric('report_http_request_duration_seconds', '请求处理耗时（含响应发送）',
+                              'histogram', ('route', 'method', 'status'), METRIC_BUCKETS)
+http_response_bytes = Metric('report_http_response_bytes_total', '响应体字节数', 'counter', ('route',))
+http_in_flight = Metric('report_http_requests_in_flight', '处理中的请求数', 'gauge', ('route',))
+db_query_seconds = Metric('report_db_query_duration_seconds', '数据库查询耗时（执行及取回结果）',
+                          'histogram', ('query',), METRIC_BUCKETS)
+db_rows_fetched = Metric('report_db_rows_fetched_total', '从数据库取回的行数', 'counter', ('query',))
+serialization_seconds = Metric('report_serialization_duration_seconds', 'JSON响应体编码耗时',
+                               'histogram', ('payload',), METRIC_BUCKETS)
+METRICS = (http_request_seconds, http_response_bytes, http_in_flight, db_query_seconds, db_rows_fetched, serialization_seconds)
+
+# 指标中的route标签：已知接口用路径本身，页面和静态文件各归为一类，避免标签取值无限增长
+METRIC_ROUTES = {path: path for path in (
+    '/api/report', '/api/recycling/report', '/api/recycling/export', '/api/recycling/summary',
+    '/api/recycling/facets', '/api/recycling/data', '/api/recycling', '/api/years', '/api/cache/stats',
+    '/api/warmer/status', '/api/db-test', '/metrics')}
+METRIC_ROUTES.update((path, 'page') for path in ('/', '/iqc', '/iqc.html', '/recycling', '/recycling.html'))
+
+def route_label(path):
+    label = METRIC_ROUTES.get(path)
+    if label is not None:
+        return label
+    return 'api_other' if path.startswith('/api/') else 'static'
+
+def observe_request(route, method, status, seconds, body_bytes):
+    http_request_seconds.observe(seconds, route, method, status)
+    http_response_bytes.inc(body_bytes, route)
+
+def fetch_all(cur, query, sql, params=None):
+    """执行查询并取回全部结果，按query记录数据库耗时和行数"""
+    start = time.perf_counter()
+    cur.execute(sql, params)
+    rows = cur.fetchall()
+    db_query_seconds.observe(time.perf_counter() - start, query)
+    db_rows_fetched.inc(len(rows), query)
+    return rows
+
+def encode_json(payload, data, **kwargs):
+    """把data编码为JSON的UTF-8字节，按payload记录编码耗时"""
+    start = time.perf_counter()
+    body = json.dumps(data, **kwargs).encode('utf-8')
+    serialization_seconds.observe(time.perf_counter() - start, payload)
+    return body
+
+def year_range(year):
+    """返回年份对应的半开时间区间[当年1月1日, 次年1月1日)"""
+    year = int(year)
+    return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+
+def period_params(periods):
+    """将[(开始时间, 结束时间)]转换为IQC_REPORT_SQL的参数（开始时间数组, 结束时间数组）"""
+    return [start for start, _ in periods], [end for _, end in periods]
+
+# IQC报表查询：先对统计区间内出货lot的AOI缺陷做一次分组汇总（C4010站，A类为黑缺陷、B类为白缺陷），
+# 再与lot表关联一次，避免对每个lot执行两次相关子查询。
+# 支持一次查询多个统计区间（多年对比/任意日期区间），结果按period_no（从1开始）区分
+IQC_REPORT_SQL = """
+    WITH period AS (
+        SELECT p.start_time, p.end_time, p.period_no
+        FROM unnest(%s::timestamp[], %s::timestamp[]) WITH ORDINALITY AS p(start_time, end_time, period_no)
+    ),
+    shipped_lot AS (
+        SELECT p.period_no, l.lot_name, l.event_time, l.material_def_id
+        FROM period p
+        JOIN lot l ON l.event_time >= p.start_time AND l.event_time < p.end_time  -- 半开区间，可走索引
+        WHERE l.lot_state = 'Shipped'
+    ),
+    lot_defect AS (  -- 每个lot的黑/白缺陷数，只扫描一次AOI表
+        SELECT
+            aaf.order_no AS lot_name,
+            COUNT(aafi.sno) FILTER (WHERE aafi.kind IN ('A1','A2','A3','A4')) AS black_count,
+            COUNT(aafi.sno) FILTER (WHERE aafi.kind IN ('B1','B2','B3','B4')) AS white_count
+        FROM analyze_aoi_field_item aafi
+        JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id
+        WHERE aaf.process_flow_seq_name = 'C4010'
+            AND aafi.kind IN ('A1','A2','A3','A4','B1','B2','B3','B4')
+            AND aaf.order_no IN (SELECT lot_name FROM shipped_lot)
+        GROUP BY aaf.order_no
+    )
+    SELECT
+        l.period_no,
+        DATE_TRUNC('month', l.event_time) AS month,  -- 按月份截断时间
+        CASE WHEN cd.vendor IS NULL THEN 'Unknown' ELSE cd.vendor END AS vendor,  -- 供应商字段，保持原始供应商名称，NULL值转换为'Unknown'
+        CASE
+            WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '02' THEN 'Quartz'
+            WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '01' THEN 'Soda'
+            ELSE 'Other'  -- 如果不是01或02，可以归类为Other或其他默认值
+        END AS material_type,  -- 区分Quartz和Soda
+        COUNT(l.lot_name) AS shipped_lot_count,  -- 统计当月lot_name的个数作为实际生产数量
+        ROUND(AVG(COALESCE(d.black_count, 0)::float)::numeric, 3) AS avg_black,  -- 无缺陷记录的lot按0计入平均
+        ROUND(AVG(COALESCE(d.white_count, 0)::float)::numeric, 3) AS avg_white,
+        SUM(COALESCE(d.black_count, 0)) AS black_sum,  -- 缺陷数之和，供本地月度汇总库保存
+        SUM(COALESCE(d.white_count, 0)) AS white_sum
+    FROM shipped_lot l
+    LEFT JOIN consumable_def cd ON l.material_def_id = cd.consumable_def_name  -- 添加关联条件
+    LEFT JOIN lot_defect d ON d.lot_name = l.lot_name
+    GROUP BY 1, 2, 3, 4;  -- 按统计区间、月份、vendor和material_type分组
+"""
+
+# 报表JSON结构或计算方式版本，变化时递增，使磁盘上的旧缓存失效
+IQC_REPORT_FORMAT_VERSION = 3
+
+IQC_REPORT_COLUMNS = ['period_no', 'month', 'vendor', 'material_type', 'shipped_lot_count', 'avg_black', 'avg_white',
+                      'black_sum', 'white_sum']
+IQC_MATERIAL_TYPES = ['Quartz', 'Soda', 'Other']
+IQC_MEASURES = ['production', 'white_defect', 'black_defect']
+IQC_EMPTY_MEASURES = {measure: 0 for measure in IQC_MEASURES}
+MONTH_INDEX = pd.Index(range(1, 13), name='month')
+
+# 回收版报表查询分两段：keyed先按筛选条件取出lot基本信息，按有索引的(event_time, lot_name)排序分页，
+# 再为当页的lot计算上片时间locktime、机台和AOI缺陷数；每个属性在一个LATERAL子查询中只计算一次
+# 每个lot的htm_no：与原查询一致，按htm_no降序取第一条（NULL排在最前）
+RECYCLING_HTM_LATERAL_SQL = """
+        LEFT JOIN LATERAL (
+            SELECT ecdp.htm_no
+            FROM erp_cam_design_param ecdp
+            WHERE ecdp.lot_name = l.lot_name
+            ORDER BY ecdp.htm_no DESC
+            LIMIT 1
+        ) htm ON true
+"""
+
+RECYCLING_KEYED_SQL = """
+    SELECT 
+        l.customer_name,
+        l.lot_name,
+        l.model_id,
+        l.cd,
+        l.process_layer,
+        l.material_id,
+        cd.vendor,
+        l.lot_type,
+        l.product_size,
+        htm.htm_no,
+        l.event_time,
+        l.product_type
+    FROM 
+        lot l 
+        INNER JOIN consumable_def cd ON l.material_def_id = cd.consumable_def_name
+""" + RECYCLING_HTM_LATERAL_SQL + """    WHERE 
+        cd.description LIKE 'R%%'
+        AND cd.consumable_type = '主原材料'
+        AND l.material_id IS NOT NULL
+        AND l.lot_name IS NOT NULL
+        AND l.lot_name != ''
+"""
+
+# page中每个lot在C4010/C4017站点的黑白缺陷数
+RECYCLING_AOI_LATERAL_SQL = """
+        LEFT JOIN LATERAL (
+            SELECT COUNT(aafi.sno) FILTER (WHERE aafi.kind IN ('A1','A2','A3','A4') AND aaf.process_flow_seq_name = 'C4010') AS black_c4010,
+                   COUNT(aafi.sno) FILTER (WHERE aafi.kind IN ('A1','A2','A3','A4') AND aaf.process_flow_seq_name = 'C4017') AS black_c4017,
+                   COUNT(aafi.sno) FILTER (WHERE aafi.kind IN ('B1','B2','B3','B4') AND aaf.process_flow_seq_name = 'C4010') AS white_c4010,
+                   COUNT(aafi.sno) FILTER (WHERE aafi.kind IN ('B1','B2','B3','B4') AND aaf.process_flow_seq_name = 'C4017') AS white_c4017
+            FROM analyze_aoi_field aaf
+            JOIN analyze_aoi_field_item aafi ON aafi.af_id = aaf.id
+            WHERE aaf.order_no = p.lot_name
+                AND aaf.process_flow_seq_name IN ('C4010', 'C4017')
+        ) aoi ON true
+"""
+
+RECYCLING_DETAIL_SQL = """
+    SELECT 
+        p.customer_name,
+        p.lot_name,
+        p.model_id,
+        NULLIF(CONCAT_WS('/', NULLIF(eq.a2020, ''), NULLIF(eq.a2022, '')), '') AS equipment,
+        p.cd,
+        p.process_layer,
+        (CASE 
+            WHEN p.htm_no = 2
+            THEN CONCAT(
+                TO_CHAR(run.a2020, 'YYYY-MM-DD HH24:MI:SS'),
+                ';',
+                TO_CHAR(run.a2022, 'YYYY-MM-DD HH24:MI:SS')
+            )
+            ELSE TO_CHAR(run.a2020, 'YYYY-MM-DD HH24:MI:SS')
+         END) AS locktime,
+        p.material_id,
+        p.vendor,
+        p.lot_type,
+        p.product_size as product_size,
+        (CASE 
+            WHEN p.htm_no = 2
+            THEN aoi.black_c4010::text || ';' || aoi.black_c4017::text
+            ELSE aoi.black_c4010::text
+         END) AS black,
+        (CASE 
+            WHEN p.htm_no = 2
+            THEN aoi.white_c4010::text || ';' || aoi.white_c4017::text
+            ELSE aoi.white_c4010::text
+         END) AS white,
+        p.event_time as repairtime,
+        p.product_type
+    FROM 
+        page p
+        -- A2020/A2022站点首次Run时间
+        LEFT JOIN LATERAL (
+            SELECT MIN(lh.event_time) FILTER (WHERE lh.process_seq_name = 'A2020') AS a2020,
+                   MIN(lh.event_time) FILTER (WHERE lh.process_seq_name = 'A2022') AS a2022
+            FROM lot_history lh
+            WHERE lh.lot_name = p.lot_name
+                AND lh.process_seq_name IN ('A2020', 'A2022')
+                AND lh.lot_process_state = 'Run'
+        ) run ON true
+        -- A2020/A2022站点机台
+        LEFT JOIN LATERAL (
+            SELECT MAX(les.equipment_name) FILTER (WHERE les.process_seq_name = 'A2020') AS a2020,
+                   MAX(les.equipment_name) FILTER (WHERE les.process_seq_name = 'A2022') AS a2022
+            FROM lot_engineer_setting les
+            WHERE les.lot_name = p.lot_name
+                AND les.process_seq_name IN ('A2020', 'A2022')
+        ) eq ON true
+""" + RECYCLING_AOI_LATERAL_SQL
+
+# 回收版汇总：总计及按供应商、按客户的lot数和各站点黑白缺陷数，一次GROUPING SETS查询完成；
+# 与明细一致，C4017站点只计入htm_no=2的lot
+RECYCLING_SUMMARY_SQL = """
+    SELECT 
+        GROUPING(p.vendor) = 0 AS by_vendor,
+        GROUPING(p.customer_name) = 0 AS by_customer,
+        p.vendor,
+        p.customer_name,
+        COUNT(*) AS lot_count,
+        COALESCE(SUM(aoi.black_c4010), 0) AS black_c4010,
+        COALESCE(SUM(aoi.black_c4017) FILTER (WHERE p.htm_no = 2), 0) AS black_c4017,
+        COALESCE(SUM(aoi.white_c4010), 0) AS white_c4010,
+        COALESCE(SUM(aoi.white_c4017) FILTER (WHERE p.htm_no = 2), 0) AS white_c4017
+    FROM 
+        page p""" + RECYCLING_AOI_LATERAL_SQL + """    GROUP BY GROUPING SETS ((), (p.vendor), (p.customer_name))
+"""
+
+# 排序与分页游标一致：出货时间降序，相同时按lot_name降序；lot(event_time, lot_name)索引反向扫描即为该顺序，
+# 分页时只读取游标之后的limit行，不需要先对全部符合条件的lot排序
+RECYCLING_ORDER_BY = "event_time DESC, lot_name DESC"
+
+# 只用lot和consumable_def的回收版基础筛选，不计算各lot的属性
+RECYCLING_BASE_FROM_SQL = """
+    FROM 
+        lot l 
+        INNER JOIN consumable_def cd ON l.material_def_id = cd.consumable_def_name
+    WHERE 
+        cd.description LIKE 'R%%'
+        AND cd.consumable_type = '主原材料'
+        AND l.material_id IS NOT NULL
+        AND l.lot_name IS NOT NULL
+        AND l.lot_name != ''
+"""
+
+# 符合筛选条件的lot数
+RECYCLING_COUNT_SQL = "\n    SELECT COUNT(*) AS total" + RECYCLING_BASE_FROM_SQL
+
+RECYCLING_MAX_LIMIT = int(os.getenv('RECYCLING_MAX_LIMIT', '1000'))
+# 流式输出时服务端游标每次读取的行数
+RECYCLING_STREAM_ITERSIZE = int(os.getenv('RECYCLING_STREAM_ITERSIZE', '2000'))
+
+# 回收版查询的筛选参数 -> 对应列（等值匹配）
+RECYCLING_EQUAL_FILTERS = {
+    'customer': 'l.customer_name',
+    'supplier': 'cd.vendor',
+    'orderType': 'l.lot_type',
+}
+
+# 回收版查询的筛选参数 -> 对应列（前缀匹配，依赖text_pattern_ops索引）
+RECYCLING_PREFIX_FILTERS = {
+    'processNumber': 'l.lot_name',
+    'batchNumber': 'l.material_id',
+}
+
+def parse_recycling_filters(query_params):
+    """从URL查询参数解析回收版筛选条件，日期区间为start/end(YYYY-MM-DD，均含当天)"""
+    filters = {}
+    for name in (*RECYCLING_EQUAL_FILTERS, *RECYCLING_PREFIX_FILTERS):
+        if query_params.get(name, [''])[0]:
+            filters[name] = query_params[name][0]
+    if 'year' in query_params:
+        filters['year'] = int(query_params['year'][0])
+    if 'start' in query_params or 'end' in query_params:
+        start = datetime.strptime(query_params['start'][0], '%Y-%m-%d')
+        end = datetime.strptime(query_params['end'][0], '%Y-%m-%d')
+        if end < start:
+            raise ValueError("结束日期不能早于开始日期")
+        filters['start'] = query_params['start'][0]
+        filters['end'] = query_params['end'][0]
+    return filters
+
+def escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def recycling_where(filters):
+    """把筛选条件转换为参数化的WHERE子句(以AND开头)和参数列表"""
+    # 日期区间优先于年份，都未指定时取当年（半开区间）
+    if 'start' in filters:
+        start = datetime.strptime(filters['start'], '%Y-%m-%d')
+        end = datetime.strptime(filters['end'], '%Y-%m-%d') + timedelta(days=1)
+    else:
+        start, end = year_range(filters.get('year', datetime.now().year))
+    conditions = ["l.event_time >= %s", "l.event_time < %s"]
+    params = [start, end]
+    for name, column in RECYCLING_EQUAL_FILTERS.items():
+        if filters.get(name):
+            conditions.append(f"{column} = %s")
+            params.append(filters[name])
+    for name, column in RECYCLING_PREFIX_FILTERS.items():
+        if filters.get(name):
+            conditions.append(f"{column} LIKE %s")
+            params.append(escape_like(filters[name]) + '%')
+    return " AND " + " AND ".join(conditions), params
+
+def encode_recycling_cursor(row):
+    """把一页最后一行的排序键(出货时间, lot_name)编码为不透明游标"""
+    key = json.dumps([row['repairtime'].isoformat(), row['lot_name']], ensure_ascii=False)
+    return base64.urlsafe_b64encode(key.encode('utf-8')).decode('ascii')
+
+def decode_recycling_cursor(cursor):
+    try:
+        event_time, lot_name = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if not isinstance(lot_name, str):
+            raise ValueError
+        return datetime.fromisoformat(event_time), lot_name
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("无效的cursor")
+
+def build_recycling_query(filters, limit=None, cursor=None):
+    """返回带筛选条件和排序的回收版查询SQL及参数；指定limit/cursor时按(event_time, lot_name)键集分页，
+    只取游标之后的limit行，再为这些行计算上片时间、机台和缺陷数"""
+    where, params = recycling_where(filters)
+    page_sql = "SELECT * FROM keyed"
+    if cursor:
+        # 降序：游标之后是出货时间更早的行，或时间相同但lot_name更小的行（行比较可直接用索引）
+        page_sql += " WHERE (event_time, lot_name) < (%s, %s)"
+        params.extend(decode_recycling_cursor(cursor))
+    if limit is not None:
+        page_sql += f" ORDER BY {RECYCLING_ORDER_BY} LIMIT %s"
+        params.append(limit)
+    sql = (f"WITH keyed AS ({RECYCLING_KEYED_SQL}{where}\n), page AS ({page_sql})"
+           f"{RECYCLING_DETAIL_SQL}    ORDER BY {RECYCLING_ORDER_BY}")
+    return sql, params
+
+def build_recycling_summary_query(filters):
+    where, params = recycling_where(filters)
+    return f"WITH page AS ({RECYCLING_KEYED_SQL}{where}\n){RECYCLING_SUMMARY_SQL}", params
+
+def build_recycling_facets_query(filters):
+    """各筛选项(客户、供应商、订单类型)的取值及lot数，一次GROUPING SETS查询完成。
+    每个筛选项的计数只应用其他筛选项的条件，日期和前缀条件对所有筛选项生效"""
+    facets = list(RECYCLING_EQUAL_FILTERS.items())
+    where, where_params = recycling_where({k: v for k, v in filters.items() if k not in RECYCLING_EQUAL_FILTERS})
+    columns, params = [], []
+    for i, (name, column) in enumerate(facets):
+        columns.append(f"{column} AS f{i}")
+        if filters.get(name):
+            columns.append(f"{column} = %s AS m{i}")
+            params.append(filters[name])
+        else:
+            columns.append(f"true AS m{i}")
+    selects = []
+    for i in range(len(facets)):
+        others = " AND ".join(f"m{j}" for j in range(len(facets)) if j != i) or "true"
+        selects += [f"GROUPING(f{i}) = 0 AS g{i}", f"f{i}", f"COUNT(*) FILTER (WHERE {others}) AS c{i}"]
+    sql = (f"WITH base AS (\n    SELECT {', '.join(columns)}{RECYCLING_BASE_FROM_SQL}{where}\n)\n"
+           f"SELECT {', '.join(selects)}\nFROM base\n"
+           f"GROUP BY GROUPING SETS ({', '.join(f'(f{i})' for i in range(len(facets)))})")
+    return sql, params + where_params
+
+def count_recycling_rows(cur, filters):
+    where, params = recycling_where(filters)
+    return fetch_all(cur, 'recycling_count', RECYCLING_COUNT_SQL + where, params)[0]['total']
+
+def query_iqc_rows(periods):
+    """执行IQC报表查询，periods为[(开始时间, 结束时间)]，所有区间在一次查询中完成"""
+    # 连接数据库获取真实数据
+    with db_pool.connection() as conn:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        results = fetch_all(cur, 'iqc_report', IQC_REPORT_SQL, period_params(periods))
+    # 打印查询结果的前几行，用于调试lot表结构
+    print(f"查询结果前2行: {results[:2]}")
+    
+    return pd.DataFrame(results, columns=IQC_REPORT_COLUMNS)
+
+# 数据库中最早/最晚的出货时间，可直接从lot(lot_state, event_time)索引两端取得
+SHIPPED_BOUNDS_SQL = """
+    SELECT MIN(l.event_time) AS first_time, MAX(l.event_time) AS last_time
+    FROM lot l
+    WHERE l.lot_state = 'Shipped'
+"""
+
+# 各年份出货lot数，每年一次索引范围计数
+YEAR_LOT_COUNTS_SQL = """
+    SELECT y AS year,
+           (SELECT COUNT(*)
+            FROM lot l
+            WHERE l.lot_state = 'Shipped'
+                AND l.event_time >= make_timestamp(y, 1, 1, 0, 0, 0)
+                AND l.event_time < make_timestamp(y + 1, 1, 1, 0, 0, 0)) AS lot_count
+    FROM generate_series(%s, %s) AS y
+"""
+
+def month_start(value):
+    """返回所在月份的1日零点"""
+    return datetime(value.year, value.month, 1)
+
+def is_month_start(value):
+    return value == month_start(value)
+
+class IqcAggregateStore:
+    """IQC月度汇总本地库(SQLite)，保存已关闭月份每个(月份, 供应商, 材料类型)的出货数和缺陷数之和。
+
+    水位线(watermark)之前的月份视为已关闭、不再变化，报表直接从本地库读取；
+    水位线及之后的月份仍实时查询数据库。刷新任务只查询水位线之后、当月之前的月份并推进水位线。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.initialized = False
+
+    def connect(self):
+        if not self.initialized:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self.initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS iqc_monthly (
+                    month TEXT NOT NULL,  -- YYYY-MM
+                    vendor TEXT NOT NULL,
+                    material_type TEXT NOT NULL,
+                    shipped_lot_count INTEGER NOT NULL,
+                    black_sum INTEGER NOT NULL,
+                    white_sum INTEGER NOT NULL,
+                    PRIMARY KEY (month, vendor, material_type)
+                )
+            """)
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.commit()
+            self.initialized = True
+        return conn
+
+    def watermark(self):
+        """返回第一个未关闭月份的1日，本地库为空时返回None"""
+        if not self.path:
+            return None
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'watermark'").fetchone()
+        finally:
+            conn.close()
+        return datetime.strptime(row[0], '%Y-%m') if row else None
+
+    def split_periods(self, periods):
+        """将统计区间拆分为本地库可覆盖部分和需实时查询部分，均为[(区间序号, 开始时间, 结束时间)]"""
+        watermark = self.watermark()
+        stored, live = [], []
+        for period_no, (start, end) in enumerate(periods, start=1):
+            closed_end = min(end, watermark) if watermark else None
+            # 只有按整月对齐的部分可以使用月度汇总
+            if closed_end and start < closed_end and is_month_start(start) and is_month_start(closed_end):
+                stored.append((period_no, start, closed_end))
+                if end > closed_end:
+                    live.append((period_no, closed_end, end))
+            else:
+                live.append((period_no, start, end))
+        return stored, live
+
+    def load_rows(self, parts):
+        """读取本地库中的月度汇总，返回与IQC查询结果相同列的DataFrame"""
+        rows = []
+        conn = self.connect()
+        try:
+            for period_no, start, end in parts:
+                cursor = conn.execute(
+                    "SELECT month, vendor, material_type, shipped_lot_count, black_sum, white_sum "
+                    "FROM iqc_monthly WHERE month >= ? AND month < ?",
+                    (start.strftime('%Y-%m'), end.strftime('%Y-%m')),
+                )
+                for month, vendor, material_type, count, black_sum, white_sum in cursor:
+                    rows.append({
+                        'period_no': period_no,
+                        'month': datetime.strptime(month, '%Y-%m'),
+                        'vendor': vendor,
+                        'material_type': material_type,
+                        'shipped_lot_count': count,
+                        # 与数据库ROUND(AVG(...), 3)一致：四舍五入到3位小数
+                        'avg_black': (Decimal(black_sum) / count).quantize(Decimal('0.001'), ROUND_HALF_UP),
+                        'avg_white': (Decimal(white_sum) / count).quantize(Decimal('0.001'), ROUND_HALF_UP),
+                        'black_sum': black_sum,
+                        'white_sum': white_sum,
+                    })
+        finally:
+            conn.close()
+        return pd.DataFrame(rows, columns=IQC_REPORT_COLUMNS)
+
+    def refresh(self):
+        """将水位线到当月之前的已关闭月份写入本地库并推进水位线，返回写入的行数"""
+        if not self.path:
+            return 0
+        with self.lock:
+            current_month = month_start(datetime.now())
+            watermark = self.watermark()
+            if watermark is None:
+                watermark = self.first_shipped_month()
+                if watermark is None:
+                    return 0
+            if watermark >= current_month:
+                return 0
+
+            df = query_iqc_rows([(watermark, current_month)])
+            conn = self.connect()
+            try:
+                with conn:  # 同一事务内替换月份数据并推进水位线
+                    conn.execute(
+                        "DELETE FROM iqc_monthly WHERE month >= ? AND month < ?",
+                        (watermark.strftime('%Y-%m'), current_month.strftime('%Y-%m')),
+                    )
+                    conn.executemany(
+                        "INSERT INTO iqc_monthly VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (row.month.strftime('%Y-%m'), row.vendor, row.material_type,
+                             int(row.shipped_lot_count), int(row.black_sum), int(row.white_sum))
+                            for row in df.itertuples()
+                        ],
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta VALUES ('watermark', ?)",
+                        (current_month.strftime('%Y-%m'),),
+                    )
+            finally:
+                conn.close()
+            print(f"IQC月度汇总已更新: {watermark:%Y-%m} ~ {current_month:%Y-%m}（不含）, {len(df)} 行")
+            return len(df)
+
+    def first_shipped_month(self):
+        with db_pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(SHIPPED_BOUNDS_SQL)
+            first = cur.fetchone()[0]
+        return month_start(first) if first else None
+
+iqc_aggregate_store = IqcAggregateStore(os.getenv('IQC_AGGREGATE_STORE', os.path.join(REPORT_CACHE_DIR, 'iqc_aggregate.sqlite3')))
+
+def fetch_iqc_rows(periods):
+    """获取各统计区间的IQC月度汇总行：已关闭月份读取本地汇总库，其余部分合并为一次数据库查询"""
+    stored, live = iqc_aggregate_store.split_periods(periods)
+    frames = []
+    if stored:
+        frames.append(iqc_aggregate_store.load_rows(stored))
+    if live:
+        df = query_iqc_rows([(start, end) for _, start, end in live])
+        # 查询中的区间序号按传入顺序编号，映射回原始区间序号
+        df['period_no'] = df['period_no'].map({i: period_no for i, (period_no, _, _) in enumerate(live, start=1)})
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=IQC_REPORT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+def build_iqc_report(year):
+    """查询数据库并按材料类型、月份和供应商汇总IQC报表数据"""
+    return pivot_iqc_year(fetch_iqc_rows([year_range(year)]))
+
+def pivot_iqc_year(df):
+    """透视单年的IQC查询结果，月份为1-12"""
+    df = df.assign(month=pd.to_datetime(df['month']).dt.month)  # 提取月份
+    return pivot_iqc_report(df, MONTH_INDEX)
+
+def build_iqc_period_report(periods):
+    """一次查询汇总多个统计区间的IQC报表，periods为[(名称, 开始时间, 结束时间)]，月份键为YYYY-MM"""
+    df = fetch_iqc_rows([(start, end) for _, start, end in periods])
+    df['month'] = pd.to_datetime(df['month']).dt.strftime('%Y-%m')
+
+    report_data = {'vendors': sorted(df['vendor'].unique().tolist()), 'periods': {}}
+    for period_no, (label, start, end) in enumerate(periods, start=1):
+        months = pd.period_range(start, end - timedelta(microseconds=1), freq='M').strftime('%Y-%m')
+        report_data['periods'][label] = pivot_iqc_report(df[df['period_no'] == period_no], pd.Index(months, name='month'))
+    return report_data
+
+def parse_report_periods(data):
+    """解析报表请求中的多年份(years)或日期区间(start/end，均含当天)，返回[(名称, 开始时间, 结束时间)]；
+    两者都未指定时返回None，按单一year处理"""
+    if 'years' in data:
+        years = sorted({int(year) for year in data['years']})
+        if not years:
+            raise ValueError("years不能为空")
+        return [(str(year), *year_range(year)) for year in years]
+    if 'start' in data or 'end' in data:
+        if 'start' not in data or 'end' not in data:
+            raise ValueError("日期区间需同时指定start和end")
+        start = datetime.strptime(data['start'], '%Y-%m-%d')
+        end = datetime.strptime(data['end'], '%Y-%m-%d')
+        if end < start:
+            raise ValueError("结束日期不能早于开始日期")
+        return [(f"{data['start']}~{data['end']}", start, end + timedelta(days=1))]
+    return None
+
+def normalize_material_type(material_type):
+    """校验材料类型参数，返回小写名称，未指定时为all"""
+    material_type = (material_type or 'all').lower()
+    if material_type != 'all' and material_type not in (m.lower() for m in IQC_MATERIAL_TYPES):
+        raise ValueError(f"不支持的材料类型: {material_type}")
+    return material_type
+
+def select_material(report_data, material_type):
+    """只保留指定材料类型的报表数据"""
+    if material_type == 'all':
+        return report_data
+    return {'vendors': report_data['vendors'], material_type: report_data[material_type]}
+
+def pivot_iqc_report(df, month_index):
+    """将IQC查询结果(月份×供应商×材料类型)透视为报表数据，各材料类型走同一套计算。
+
+    df的month列需已转换为month_index中的月份键（单年报表为1-12，区间报表为YYYY-MM）。
+    """
+    df = df.assign(
+        production=df['shipped_lot_count'].astype(float),
+        white_defect=df['avg_white'].astype(float),
+        black_defect=df['avg_black'].astype(float),
+    )
+    # 所有供应商（跨材料类型），每种材料的供应商明细都按该列表补齐
+    vendors = sorted(df['vendor'].unique().tolist())
+
+    report_data = {'vendors': vendors}
+    for material_type in IQC_MATERIAL_TYPES:
+        report_data[material_type.lower()] = pivot_material_report(df[df['material_type'] == material_type], vendors, month_index)
+    return report_data
+
+def group_sum(values, keys, index):
+    """按keys分组累加values的各列，返回以index为行的DataFrame，没有数据的分组为0。
+    np.add.at按行的顺序逐个相加，与逐行累加的结果一致（pandas的groupby求和使用补偿求和，末位可能不同）"""
+    totals = np.zeros((len(index), len(values.columns)))
+    np.add.at(totals, index.get_indexer(keys), values.to_numpy(dtype=float))
+    return pd.DataFrame(totals, index=index, columns=values.columns)
+
+def pivot_material_report(df, vendors, month_index):
+    """计算单一材料类型的月度汇总、供应商月度明细和供应商平均值。
+    汇总和缺陷率用pandas向量化计算，输出时再用Python的round保留两位小数"""
+    # 按(月份, 供应商)汇总，同一供应商多行时累加
+    keys = pd.MultiIndex.from_frame(df[['month', 'vendor']])
+    by_vendor = group_sum(df[IQC_MEASURES], keys, keys.unique().sort_values())
+    month_vendors = {month: {} for month in month_index}
+    for (month, vendor), values in by_vendor.to_dict('index').items():
+        month_vendors[month][vendor] = values
+
+    # 月度汇总：缺陷值为各供应商缺陷之和除以当月生产数
+    by_month = group_sum(df[IQC_MEASURES], df['month'], month_index)
+    production = by_month['production']
+    rates = by_month[['white_defect', 'black_defect']].div(production.where(production > 0), axis=0).fillna(0)
+    monthly_data = []
+    for month, production, white, black in zip(month_index, production.tolist(),
+                                                rates['white_defect'].tolist(), rates['black_defect'].tolist()):
+        if not month_vendors[month]:
+            monthly_data.append({'month': month, **IQC_EMPTY_MEASURES, 'vendors': {}})
+            continue
+        monthly_data.append({
+            'month': month,
+            'production': production,
+            'white_defect': round(white, 2) if production > 0 else 0,
+            'black_defect': round(black, 2) if production > 0 else 0,
+            'vendors': month_vendors[month],
+        })
+
+    # 平均值按实际有数据的月份数，对输出的月度值（已保留两位小数）求平均
+    active = [data for data in monthly_data if any(data[measure] > 0 for measure in IQC_MEASURES)]
+
+    # 供应商×月份补齐为完整网格，未出货的月份填0
+    vendor_data = {
+        vendor: [{'month': month, **month_vendors[month].get(vendor, IQC_EMPTY_MEASURES)} for month in month_index]
+        for vendor in vendors
+    }
+
+    # 供应商平均值按该供应商有出货的月份数计算（by_vendor按月份排序，逐月累加）
+    shipped = by_vendor[by_vendor['production'] > 0]
+    shipped_vendors = shipped.index.get_level_values('vendor')
+    vendor_index = pd.Index(vendors)
+    vendor_totals = group_sum(shipped, shipped_vendors, vendor_index).to_dict('index')
+    vendor_months = shipped_vendors.value_counts().reindex(vendor_index, fill_value=0).to_dict()
+    vendor_averages = {vendor: average_measures(vendor_totals[vendor], vendor_months[vendor]) for vendor in vendors}
+
+    return {
+        'monthly_data': monthly_data,
+        **average_measures(sum_measures(active), len(active)),
+        'vendor_data': vendor_data,
+        'vendor_averages': vendor_averages,
+    }
+
+def sum_measures(rows):
+    """按行的顺序累加各指标"""
+    return {measure: sum(row[measure] for row in rows) for measure in IQC_MEASURES}
+
+def average_measures(totals, month_count):
+    """按月份数求平均：生产数取整，缺陷值保留两位小数"""
+    month_count = int(month_count)
+    if month_count <= 0:
+        return {'avg_production': 0, 'avg_white_defect': 0, 'avg_black_defect': 0}
+    return {
+        'avg_production': round(totals['production'] / month_count) if totals['production'] else 0,
+        'avg_white_defect': round(totals['white_defect'] / month_count, 2) if totals['white_defect'] else 0,
+        'avg_black_defect': round(totals['black_defect'] / month_count, 2) if totals['black_defect'] else 0,
+    }
+
+# 当年出货lot的指纹（数量+最新时间），用于判断当年报表缓存是否因新出货而失效
+SHIPPED_FINGERPRINT_SQL = """
+    SELECT COUNT(*) AS lot_count, MAX(l.event_time) AS last_event_time
+    FROM lot l
+    WHERE l.lot_state = 'Shipped'
+        AND l.event_time >= %s AND l.event_time < %s
+"""
+
+def get_shipped_fingerprint(year):
+    """返回某年出货lot的指纹字符串"""
+    with db_pool.connection() as conn:
+        cur = conn.cursor()
+        lot_count, last_event_time = fetch_all(cur, 'shipped_fingerprint', SHIPPED_FINGERPRINT_SQL, year_range(year))[0]
+        return f"{lot_count}|{last_event_time}"
+
+def write_atomic(path, data):
+    """先写同目录下的唯一临时文件再原子替换，避免进程中断或多个进程同时写入留下半个文件"""
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.',
+                                     suffix='.tmp', delete=False) as f:
+        f.write(data)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+class ReportCache:
+    """IQC报表结果缓存，按(年份, 材料类型)缓存已编码的JSON字节并持久化到本地目录。
+
+    在该年结束后生成的缓存永久有效（往年数据不再变化）；年内生成的缓存（包括跨年前写入的往年缓存）
+    只在TTL内有效，且出货lot指纹变化时失效；指纹在fingerprint_interval秒内最多查询一次，
+    因此新出货最多延迟这么久才反映到报表中。
+    """
+
+    def __init__(self, cache_dir, current_year_ttl, fingerprint_interval):
+        self.cache_dir = cache_dir
+        self.current_year_ttl = current_year_ttl
+        self.fingerprint_interval = fingerprint_interval
+        # (year, material_type) -> {'body', 'created_at', 'fingerprint', 'trusted_until', 'checked_at'}
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def _file_path(self, year, material_type):
+        return os.path.join(self.cache_dir, f"iqc_v{IQC_REPORT_FORMAT_VERSION}_{year}_{material_type}")
+
+    def _load_from_disk(self, year, material_type):
+        path = self._file_path(year, material_type)
+        try:
+            with open(path + '.meta.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(path + '.json', 'rb') as f:
+                body = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        return {
+            'body': body,
+            'created_at': meta['created_at'],
+            'fingerprint': meta.get('fingerprint'),
+            'trusted_until': meta.get('trusted_until', 0),
+            'checked_at': meta.get('checked_at', 0),
+        }
+
+    def _save_to_disk(self, year, material_type, entry):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._file_path(year, material_type)
+            write_atomic(path + '.json', entry['body'])
+            write_atomic(path + '.meta.json', json.dumps({key: value for key, value in entry.items() if key != 'body'}).encode())
+        except OSError as e:
+            print(f"写入报表缓存失败: {e}")
+
+    def _is_fresh(self, year, entry):
+        if entry['created_at'] >= datetime(year + 1, 1, 1).timestamp():
+            return True
+        # 后台预热写入的条目在下次预热前直接使用，不再查询数据库校验
+        if entry['trusted_until'] > time.time():
+            return True
+        if time.time() - entry['created_at'] > self.current_year_ttl:
+            return False
+        # 刚校验过指纹的条目直接使用，避免每次命中都查询数据库
+        if time.time() - entry['checked_at'] < self.fingerprint_interval:
+            return True
+        if entry['fingerprint'] != get_shipped_fingerprint(year):
+            return False
+        entry['checked_at'] = time.time()
+        return True
+
+    def _is_newer(self, entry, other):
+        """entry是否比other更新（生成时间更晚或预热信任期更长）"""
+        return entry['created_at'] > other['created_at'] or entry['trusted_until'] > other['trusted_until']
+
+    def get(self, year, material_type):
+        """返回缓存的JSON字节，未命中或已失效时返回None"""
+        key = (year, material_type)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None or not self._is_fresh(year, entry):
+            # 内存中没有或已失效时读磁盘：多进程时预热进程写入的较新结果在其他进程中同样命中
+            disk_entry = self._load_from_disk(year, material_type)
+            if disk_entry is not None and (entry is None or self._is_newer(disk_entry, entry)) \
+                    and self._is_fresh(year, disk_entry):
+                entry = disk_entry
+            else:
+                entry = None
+        if entry is not None:
+            with self.lock:
+                self.entries[key] = entry
+                self.hits += 1
+            return entry['body']
+        with self.lock:
+            self.entries.pop(key, None)
+            self.misses += 1
+        return None
+
+    def put(self, year, material_type, body, fingerprint=None, trusted_until=0):
+        # 指纹在查询前取得，写入时视为刚校验过
+        now = time.time()
+        entry = {'body': body, 'created_at': now, 'fingerprint': fingerprint,
+                 'trusted_until': trusted_until, 'checked_at': now}
+        with self.lock:
+            self.entries[(year, material_type)] = entry
+        self._save_to_disk(year, material_type, entry)
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0,
+                'entries': len(self.entries),
+                'bytes': sum(len(entry['body']) for entry in self.entries.values()),
+            }
+
+report_cache = ReportCache(REPORT_CACHE_DIR, float(os.getenv('REPORT_CACHE_TTL', '300')),
+                           float(os.getenv('REPORT_FINGERPRINT_INTERVAL', '10')))
+
+def get_iqc_report_bytes(year, material_type=None):
+    """返回IQC报表的JSON字节，优先使用缓存；material_type为quartz/soda/other时只返回对应材料"""
+    material_type = normalize_material_type(material_type)
+    body = report_cache.get(year, material_type)
+    if body is not None:
+        return body
+
+    # 当年报表先取指纹再查询，查询期间新增的出货会让下次请求重新计算
+    fingerprint = get_shipped_fingerprint(year) if year >= datetime.now().year else None
+    report_data = select_material(build_iqc_report(year), material_type)
+    body = encode_json('iqc_report', report_data)
+    report_cache.put(year, material_type, body, fingerprint)
+    return body
+
+def get_iqc_period_report_bytes(periods, material_type=None):
+    """返回多区间IQC报表的JSON字节（不缓存）"""
+    material_type = normalize_material_type(material_type)
+    report_data = build_iqc_period_report(periods)
+    report_data['periods'] = {
+        label: select_material(period_report, material_type)
+        for label, period_report in report_data['periods'].items()
+    }
+    return encode_json('iqc_report', report_data)
+
+def recycling_row(row_dict):
+    """把查询结果行转换为页面使用的字段"""
+    return {
+        'customer': str(row_dict.get('customer_name', '') or ''),
+        'processNumber': str(row_dict.get('lot_name', '') or ''),
+        'model': str(row_dict.get('model_id', '') or ''),
+        'equipment': str(row_dict.get('equipment', '') or ''),
+        'cd': str(row_dict.get('cd', '') or ''),
+        'layer': str(row_dict.get('process_layer', '') or ''),
+        'lockTime': str(row_dict.get('locktime', '') or '') ,
+        'batchNumber': str(row_dict.get('material_id', '') or ''),
+        'supplier': str(row_dict.get('vendor', '') or ''),
+        'orderType': str(row_dict.get('lot_type', '') or ''),
+        'size': str(row_dict.get('product_size', '0')) + 'mm',
+        'blackDefect': str(row_dict.get('black', '') or ''),
+        'whiteDefect': str(row_dict.get('white', '') or ''),
+        'repairTime': 0,
+        'judgeType': '',
+        'glassSource': '',
+        'polishSupplier': '',
+        'chromeSupplier': '',
+        'glueSupplier': '',
+        'recycleStatus': '',
+        'reprocessPlan': '',
+        'recycleBatch':  '',
+        'factory': 'FS',
+        'year': int(row_dict.get('create_date').year) if row_dict.get('create_date') else datetime.now().year
+    }
+
+def parse_recycling_page(query_params):
+    """解析分页参数limit/cursor/total，未指定limit时返回None(不分页)"""
+    if 'limit' not in query_params:
+        if 'cursor' in query_params:
+            raise ValueError("使用cursor时必须指定limit")
+        return None
+    limit = int(query_params['limit'][0])
+    if not 1 <= limit <= RECYCLING_MAX_LIMIT:
+        raise ValueError(f"limit必须在1到{RECYCLING_MAX_LIMIT}之间")
+    page = {'limit': limit}
+    if query_params.get('cursor', [''])[0]:
+        page['cursor'] = query_params['cursor'][0]
+        decode_recycling_cursor(page['cursor'])
+    if query_params.get('total', [''])[0] in ('1', 'true'):
+        page['total'] = True
+    return page
+
+def get_real_recycling_data(filters, page=None):
+    """从数据库获取真实的服务版使用统计报表数据；page为parse_recycling_page的结果"""
+    try:
+        # 从连接池借出连接
+        with db_pool.connection() as conn:
+            cur = conn.cursor(cursor_factory=RealDictCursor)
+            
+            # 构建SQL查询 - 筛选条件在数据库中完成；分页时多取一行用于判断是否还有下一页
+            if page:
+                sql_query, params = build_recycling_query(filters, page['limit'] + 1, page.get('cursor'))
+            else:
+                sql_query, params = build_recycling_query(filters)
+            
+            # 执行查询
+            rows = fetch_all(cur, 'recycling', sql_query, params)
+            total = count_recycling_rows(cur, filters) if page and page.get('total') else None
+            cur.close()
+        
+        next_cursor = None
+        if page and len(rows) > page['limit']:
+            rows = rows[:page['limit']]
+            next_cursor = encode_recycling_cursor(rows[-1])
+        
+        # 处理查询结果
+        data = []
+        for row in rows:
+            try:
+                data.append(recycling_row(dict(row)))
+            except Exception as e:
+                print(f"处理行数据时出错: {e}")
+                continue
+        
+        result = {'data': data}
+        if page:
+            result['limit'] = page['limit']
+            result['next_cursor'] = next_cursor
+            if page.get('total'):
+                result['total'] = total
+        else:
+            result['total'] = len(data)
+        result['filters'] = filters
+        
+        return result
+        
+    except Exception as e:
+            print(f"获取真实数据失败: {e}")
+            raise e  # 不再回退到模拟数据，直接抛出异常
+
+# 列式格式中做字典编码的低基数列
+RECYCLING_DICTIONARY_COLUMNS = ('customer', 'supplier', 'orderType', 'equipment', 'size')
+
+def to_columnar(report_data):
+    """把行格式的回收版数据转换为列式格式：
+    fields为字段顺序；所有行取值相同的列放入constants；低基数列在dictionaries中保存取值表，
+    columns中为取值下标；其余列在columns中直接保存取值。分页、总数等其他键保持不变"""
+    rows = report_data['data']
+    fields = list(rows[0]) if rows else []
+    constants, dictionaries, columns = {}, {}, {}
+    for field in fields:
+        values = [row[field] for row in rows]
+        if values and all(value == values[0] for value in values):
+            constants[field] = values[0]
+        elif field in RECYCLING_DICTIONARY_COLUMNS:
+            index = {}
+            columns[field] = [index.setdefault(value, len(index)) for value in values]
+            dictionaries[field] = list(index)
+        else:
+            columns[field] = values
+    columnar = {key: value for key, value in report_data.items() if key != 'data'}
+    columnar.update(format='columnar', count=len(rows), fields=fields,
+                    constants=constants, dictionaries=dictionaries, columns=columns)
+    return columnar
+
+def get_recycling_bytes(filters, page=None, columnar=False):
+    """查询回收版数据并编码为JSON字节，columnar为True时使用列式格式"""
+    # 强制使用真实数据，不再回退到模拟数据
+    try:
+        report_data = get_real_recycling_data(filters, page)
+        print("成功获取真实数据库数据")
+    except Exception as e:
+        print(f"获取真实数据失败: {e}")
+        raise e
+    print(f"获取到数据: {len(report_data.get('data', []))} 条记录")
+    if columnar:
+        report_data = to_columnar(report_data)
+    return encode_json('recycling', report_data, ensure_ascii=False, default=str)
+
+def iter_recycling_rows(filters, itersize=None):
+    """用服务端游标逐批读取回收版数据，逐行生成页面字段；每次从数据库读取itersize行，内存占用与结果集大小无关。
+    数据库耗时只累计执行和取批次的时间，不含生成和发送响应的时间"""
+    itersize = itersize or RECYCLING_STREAM_ITERSIZE
+    db_seconds, fetched = 0, 0
+    try:
+        with db_pool.connection() as conn:
+            cur = conn.cursor(name='recycling_stream', cursor_factory=RealDictCursor)
+            sql_query, params = build_recycling_query(filters)
+            start = time.perf_counter()
+            cur.execute(sql_query, params)
+            db_seconds = time.perf_counter() - start
+            while True:
+                start = time.perf_counter()
+                rows = cur.fetchmany(itersize)
+                db_seconds += time.perf_counter() - start
+                if not rows:
+                    break
+                fetched += len(rows)
+                for row in rows:
+                    try:
+                        item = recycling_row(dict(row))
+                    except Exception as e:
+                        print(f"处理行数据时出错: {e}")
+                        continue
+                    yield item
+            cur.close()
+    finally:
+        db_query_seconds.observe(db_seconds, 'recycling_stream')
+        db_rows_fetched.inc(fetched, 'recycling_stream')
+
+def iter_recycling_json(filters, itersize=None):
+    """逐段生成回收版JSON字节，输出与get_recycling_bytes相同的结构；每itersize行生成一段"""
+    itersize = itersize or RECYCLING_STREAM_ITERSIZE
+    total = 0
+    chunk = ['{"data": [']
+    for item in iter_recycling_rows(filters, itersize):
+        encoded = json.dumps(item, ensure_ascii=False, default=str)
+        chunk.append(encoded if total == 0 else ', ' + encoded)
+        total += 1
+        if total % itersize == 0:
+            yield ''.join(chunk).encode('utf-8')
+            chunk = []
+    chunk.append(f'], "total": {total}, "filters": {json.dumps(filters, ensure_ascii=False, default=str)}}}')
+    yield ''.join(chunk).encode('utf-8')
+    print(f"流式输出完成: {total} 条记录")
+
+# 导出文件的列: (表头, 页面字段)，与recycling.html表格一致
+RECYCLING_EXPORT_COLUMNS = [
+    ('客户名称', 'customer'), ('流程单号', 'processNumber'), ('Model号', 'model'), ('制作设备', 'equipment'),
+    ('CD', 'cd'), ('图层', 'layer'), ('锁单时间', 'lockTime'), ('主材批号', 'batchNumber'),
+    ('主材供应商', 'supplier'), ('订单类型', 'orderType'), ('尺寸', 'size'), ('黑缺陷', 'blackDefect'),
+    ('白缺陷', 'whiteDefect'), ('修补时间/h', 'repairTime'), ('判定类别', 'judgeType'), ('玻璃来源', 'glassSource'),
+    ('抛光厂家', 'polishSupplier'), ('镀铬厂家', 'chromeSupplier'), ('涂胶厂家', 'glueSupplier'),
+    ('回收情况', 'recycleStatus'), ('再处理方案', 'reprocessPlan'), ('回收批次', 'recycleBatch'), ('厂别', 'factory'),
+]
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+def iter_recycling_csv(filters):
+    """逐段生成回收版CSV字节(带BOM，Excel可直接打开)，每累计约64KB输出一段"""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow([header for header, _ in RECYCLING_EXPORT_COLUMNS])
+    for item in iter_recycling_rows(filters):
+        writer.writerow([item[key] for _, key in RECYCLING_EXPORT_COLUMNS])
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+def iter_recycling_xlsx(filters):
+    """用openpyxl只写模式生成回收版XLSX并逐段输出；工作表数据写入临时文件，
+    xlsx是zip格式，需全部写完后才能输出第一段"""
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('回收报表数据')
+    sheet.append([header for header, _ in RECYCLING_EXPORT_COLUMNS])
+    for item in iter_recycling_rows(filters):
+        sheet.append([item[key] for _, key in RECYCLING_EXPORT_COLUMNS])
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while True:
+            chunk = output.read(EXPORT_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+# 导出格式 -> (生成函数, Content-Type)
+RECYCLING_EXPORT_FORMATS = {
+    'csv': (iter_recycling_csv, 'text/csv; charset=utf-8'),
+    'xlsx': (iter_recycling_xlsx, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+def recycling_filters_key(filters):
+    """将筛选条件规范化为可哈希的key"""
+    return tuple(sorted(filters.items()))
+
+def recycling_response_key(filters, page, response_format):
+    """/api/recycling响应的key，用于合并并发请求和查找预热结果"""
+    return ('recycling', recycling_filters_key(filters), recycling_filters_key(page or {}), response_format)
+
+# 后台预热的回收版分页，与recycling.html打开时的第一页请求一致（limit=10&total=1&format=columnar）
+RECYCLING_WARM_PAGE = {'limit': 10, 'total': True}
+
+class SingleFlight:
+    """合并参数相同的并发请求：同一key同时只执行一次计算，其余请求等待并共享其结果或异常"""
+
+    def __init__(self, wait_timeout):
+        self.wait_timeout = wait_timeout
+        self.calls = {}  # key -> {'done': Event, 'result', 'error'}
+        self.executed = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = {'done': threading.Event(), 'result': None, 'error': None}
+                self.calls[key] = call
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call['result'] = fn()
+            except Exception as e:
+                call['error'] = e
+                raise
+            finally:
+                with self.lock:
+                    del self.calls[key]
+                call['done'].set()
+            return call['result']
+
+        # 等待时间不超过当前请求的剩余时限
+        deadline = request_deadline.get()
+        wait_timeout = self.wait_timeout if deadline is None else max(min(self.wait_timeout, deadline.remaining()), 0)
+        if not call['done'].wait(wait_timeout):
+            with self.lock:
+                self.timeouts += 1
+            if deadline is not None and deadline.remaining() <= 0:
+                deadline.mark('timeout')
+                raise deadline.error()
+            raise TimeoutError(f"等待相同请求的计算结果超时({self.wait_timeout}秒)")
+        if isinstance(call['error'], ClientDisconnected):
+            # 执行计算的请求其客户端已断开、查询被取消，由当前请求重新执行
+            return self.do(key, fn)
+        if call['error'] is not None:
+            raise call['error']
+        return call['result']
+
+    def stats(self):
+        with self.lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'timeouts': self.timeouts,
+                'in_flight': len(self.calls),
+            }
+
+request_flight = SingleFlight(float(os.getenv('SINGLE_FLIGHT_TIMEOUT', '120')))
+
+def query_available_years():
+    """查询有出货数据的年份范围、月份跨度和各年份lot数"""
+    with db_pool.connection() as conn:
+        cur = conn.cursor()
+        first_time, last_time = fetch_all(cur, 'shipped_bounds', SHIPPED_BOUNDS_SQL)[0]
+        if first_time is None:
+            return {'years': [], 'year_counts': {}, 'first_month': None, 'last_month': None}
+        year_counts = {year: lot_count for year, lot_count in fetch_all(
+            cur, 'year_counts', YEAR_LOT_COUNTS_SQL, (first_time.year, last_time.year))}
+    return {
+        'years': sorted(year_counts, reverse=True),
+        'year_counts': {str(year): lot_count for year, lot_count in year_counts.items()},
+        'first_month': first_time.strftime('%Y-%m'),
+        'last_month': last_time.strftime('%Y-%m'),
+    }
+
+def summary_measures(row):
+    """把汇总行转换为lot数和各站点黑白缺陷数，black/white为两站点合计"""
+    measures = {'lots': row['lot_count']}
+    for color in ('black', 'white'):
+        c4010, c4017 = int(row[f'{color}_c4010']), int(row[f'{color}_c4017'])
+        measures[color] = c4010 + c4017
+        measures[f'{color}_by_station'] = {'C4010': c4010, 'C4017': c4017}
+    return measures
+
+def query_recycling_summary(filters):
+    """查询回收版汇总数据：总计、按供应商、按客户"""
+    with db_pool.connection() as conn:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        sql_query, params = build_recycling_summary_query(filters)
+        rows = fetch_all(cur, 'recycling_summary', sql_query, params)
+
+    summary = {'total': None, 'suppliers': [], 'customers': [], 'filters': filters}
+    for row in rows:
+        if row['by_vendor']:
+            summary['suppliers'].append({'supplier': row['vendor'] or '', **summary_measures(row)})
+        elif row['by_customer']:
+            summary['customers'].append({'customer': row['customer_name'] or '', **summary_measures(row)})
+        else:
+            summary['total'] = summary_measures(row)
+            # 修补时间暂无数据来源，与明细的repairTime一致为0
+            summary['total']['avg_repair_time'] = 0
+    for key, name in (('suppliers', 'supplier'), ('customers', 'customer')):
+        summary[key].sort(key=lambda item: (-item['lots'], item[name]))
+    return summary
+
+def query_recycling_facets(filters):
+    """查询各筛选项的取值和lot数，按lot数降序"""
+    with db_pool.connection() as conn:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        sql_query, params = build_recycling_facets_query(filters)
+        rows = fetch_all(cur, 'recycling_facets', sql_query, params)
+
+    names = list(RECYCLING_EQUAL_FILTERS)
+    facets = {name: [] for name in names}
+    for row in rows:
+        for i, name in enumerate(names):
+            # 空值(NULL或空字符串)不列出：筛选参数为空时表示不筛选，无法选中这些lot
+            if row[f'g{i}'] and row[f'c{i}'] and row[f'f{i}'] not in (None, ''):
+                facets[name].append({'value': str(row[f'f{i}']), 'count': row[f'c{i}']})
+    for values in facets.values():
+        values.sort(key=lambda item: (-item['count'], item['value']))
+    return {'facets': facets, 'filters': filters}
+
+class ResponseCache:
+    """按key缓存接口响应的JSON字节ttl秒，最多max_entries条，超出时淘汰最早写入的条目；
+    未命中时通过request_flight合并相同key的并发查询"""
+
+    def __init__(self, name, ttl, max_entries=256):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = {}  # key -> (JSON字节, 过期时间)
+        self.lock = threading.Lock()
+
+    def get(self, key, load):
+        cached = self.entries.get(key)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+
+        def load_and_store():
+            body = load()
+            with self.lock:
+                while len(self.entries) >= self.max_entries:
+                    self.entries.pop(next(iter(self.entries)))
+                self.entries[key] = (body, time.time() + self.ttl)
+            return body
+
+        return request_flight.do((self.name, key), load_and_store)
+
+recycling_summary_cache = ResponseCache('recycling_summary', float(os.getenv('RECYCLING_SUMMARY_TTL', '300')))
+
+recycling_facets_cache = ResponseCache('recycling_facets', float(os.getenv('RECYCLING_FACETS_TTL', '300')))
+
+def encode_recycling_facets(filters):
+    return encode_json('recycling_facets', query_recycling_facets(filters), ensure_ascii=False)
+
+def encode_recycling_summary(filters):
+    return encode_json('recycling_summary', query_recycling_summary(filters), ensure_ascii=False)
+
+def get_recycling_facets_bytes(filters):
+    """返回筛选项取值的JSON字节，优先使用后台预热的结果，否则按年份及筛选条件缓存RECYCLING_FACETS_TTL秒"""
+    key = recycling_filters_key(filters)
+    return (report_warmer.warmed_body(('recycling_facets', key))
+            or recycling_facets_cache.get(key, lambda: encode_recycling_facets(filters)))
+
+def get_recycling_summary_bytes(filters):
+    """返回回收版汇总的JSON字节，优先使用后台预热的结果，否则按筛选条件缓存RECYCLING_SUMMARY_TTL秒"""
+    key = recycling_filters_key(filters)
+    return (report_warmer.warmed_body(('recycling_summary', key))
+            or recycling_summary_cache.get(key, lambda: encode_recycling_summary(filters)))
+
+years_cache = {'body': None, 'expires_at': 0}
+YEARS_CACHE_TTL = float(os.getenv('YEARS_CACHE_TTL', '3600'))
+
+def get_years_bytes():
+    """返回可用年份的JSON字节，结果按YEARS_CACHE_TTL缓存"""
+    if years_cache['body'] is not None and years_cache['expires_at'] > time.time():
+        return years_cache['body']
+
+    def load():
+        body = encode_json('years', query_available_years())
+        years_cache.update(body=body, expires_at=time.time() + YEARS_CACHE_TTL)
+        return body
+
+    return request_flight.do(('years',), load)
+
+class ReportWarmer:
+    """后台定时预计算当年IQC报表和回收版数据，并原子替换到服务路径，使常用视图无需等待数据库；
+    同时刷新IQC本地月度汇总库。
+
+    每个报表一个调度线程，启动时立即执行一次，之后按interval加随机抖动执行；同一报表同时最多执行一次。
+    多进程运行时只有持有cache_dir下锁文件的进程执行预热，该进程退出后由其他进程接替；
+    预热结果写入cache_dir，各进程共用。
+    """
+
+    def __init__(self, interval, jitter, cache_dir):
+        self.interval = interval
+        self.jitter = jitter
+        self.cache_dir = cache_dir
+        self.lock_file = None
+        self.jobs = {'iqc_aggregate': iqc_aggregate_store.refresh, 'iqc': self.warm_iqc, 'recycling': self.warm_recycling}
+        self.job_locks = {name: threading.Lock() for name in self.jobs}
+        self.status = {
+            name: {'runs': 0, 'failures': 0, 'running': False, 'last_run': None, 'last_success': None,
+                   'duration': None, 'rows': None, 'error': None}
+            for name in self.jobs
+        }
+        self.warmed = {}  # 文件路径 -> (修改时间, JSON字节)，避免每次请求重新读取文件
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+
+    def start(self):
+        for name in self.jobs:
+            threading.Thread(target=self.run_schedule, args=(name,), name=f'warmer-{name}', daemon=True).start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def next_delay(self):
+        return self.interval + random.uniform(0, self.jitter)
+
+    def run_schedule(self, name):
+        while not self.stop_event.is_set():
+            self.run_job(name)
+            self.stop_event.wait(self.next_delay())
+
+    def is_leader(self):
+        """本进程是否持有预热锁文件；未持有时尝试获取，锁随进程退出自动释放"""
+        with self.lock:
+            if self.lock_file is None:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    lock_file = open(os.path.join(self.cache_dir, 'warmer.lock'), 'a')
+                except OSError as e:
+                    print(f"打开预热锁文件失败: {e}")
+                    return False
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    lock_file.close()
+                    return False
+                self.lock_file = lock_file
+            return True
+
+    def run_job(self, name):
+        """执行一次预热任务，上一次尚未结束或其他进程负责预热时直接跳过"""
+        if not self.is_leader():
+            return False
+        if not self.job_locks[name].acquire(blocking=False):
+            return False
+        started = time.time()
+        with self.lock:
+            self.status[name].update(running=True, last_run=datetime.now().isoformat(timespec='seconds'))
+        try:
+            rows = self.jobs[name]()
+            with self.lock:
+                self.status[name].update(
+                    runs=self.status[name]['runs'] + 1, rows=rows, error=None,
+                    last_success=datetime.now().isoformat(timespec='seconds'),
+                )
+            return True
+        except Exception as e:
+            print(f"预热{name}报表失败: {e}")
+            with self.lock:
+                self.status[name].update(failures=self.status[name]['failures'] + 1, error=str(e))
+            return False
+        finally:
+            with self.lock:
+                self.status[name].update(running=False, duration=round(time.time() - started, 3))
+            self.job_locks[name].release()
+
+    def trusted_until(self):
+        # 预热结果在下一次预热完成前有效，留出一个周期的余量应对单次失败
+        return time.time() + 2 * (self.interval + self.jitter)
+
+    def warm_iqc(self):
+        year = datetime.now().year
+        fingerprint = get_shipped_fingerprint(year)
+        df = fetch_iqc_rows([year_range(year)])
+        report_data = pivot_iqc_year(df)
+        trusted_until = self.trusted_until()
+        for material_type in ['all'] + [m.lower() for m in IQC_MATERIAL_TYPES]:
+            body = encode_json('iqc_report', select_material(report_data, material_type))
+            report_cache.put(year, material_type, body, fingerprint, trusted_until)
+        return len(df)
+
+    def warm_recycling(self):
+        # 预热回收版页面打开时的请求（不带筛选条件）：列式格式的第一页及总数、汇总和筛选项
+        filters = {}
+        key = recycling_filters_key(filters)
+        report_data = get_real_recycling_data(filters, RECYCLING_WARM_PAGE)
+        self.store(recycling_response_key(filters, RECYCLING_WARM_PAGE, 'columnar'),
+                   encode_json('recycling', to_columnar(report_data), ensure_ascii=False, default=str))
+        self.store(('recycling_summary', key), encode_recycling_summary(filters))
+        self.store(('recycling_facets', key), encode_recycling_facets(filters))
+        return len(report_data['data'])
+
+    def warmed_path(self, key):
+        digest = hashlib.sha1(json.dumps(key, default=str).encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f'warm_{key[0]}_{digest}.json')
+
+    def store(self, key, body):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            write_atomic(self.warmed_path(key), body)
+        except OSError as e:
+            print(f"写入预热结果失败: {e}")
+
+    def warmed_body(self, key):
+        """返回预热的JSON字节（可能由其他进程写入），没有或已过期时返回None"""
+        path = self.warmed_path(key)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        if time.time() - mtime > 2 * (self.interval + self.jitter):
+            return None
+        cached = self.warmed.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        self.warmed[path] = (mtime, body)
+        return body
+
+
+    def stats(self):
+        with self.lock:
+            return {
+                'enabled': self.interval > 0,
+                'leader': self.lock_file is not None,
+                'interval': self.interval,
+                'jitter': self.jitter,
+                'jobs': {name: dict(status) for name, status in self.status.items()},
+            }
+
+report_warmer = ReportWarmer(
+    float(os.getenv('REPORT_WARM_INTERVAL', '300')),
+    float(os.getenv('REPORT_WARM_JITTER', '30')),
+    REPORT_CACHE_DIR,
+)
+
+# 响应压缩：小于MIN_COMPRESS_SIZE的响应不压缩
+MIN_COMPRESS_SIZE = 1024
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'image/svg+xml')
+
+def body_etag(body):
+    """响应内容的强ETag"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def encoded_etag(etag, encoding):
+    """压缩后的响应是不同的表示，使用各自的强ETag"""
+    return etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match是否匹配该内容的任一表示（原文或各压缩格式）"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return any(encoded_etag(etag, encoding) in tags for encoding in (None, 'gzip', 'br'))
+
+def choose_encoding(accept_encoding):
+    """根据Accept-Encoding选择压缩格式，优先brotli（已安装时），其次gzip"""
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.lower()] = quality
+    wildcard = accepted.get('*', 0)
+    if brotli is not None and accepted.get('br', wildcard) > 0:
+        return 'br'
+    if accepted.get('gzip', wildcard) > 0:
+        return 'gzip'
+    return None
+
+def is_compressible(content_type):
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+class CompressedBodyCache:
+    """按(ETag, 压缩格式)缓存压缩结果，静态文件和缓存的报表内容不必每次重新压缩；总大小超过max_bytes时淘汰最久未用的条目"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, body, etag, encoding):
+        """body可以是字节，或未命中时才读取内容的函数（用于不常驻内存的大文件）"""
+        key = (etag, encoding)
+        with self.lock:
+            compressed = self.entries.get(key)
+            if compressed is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return compressed
+            self.misses += 1
+        if callable(body):
+            body = body()
+        if encoding == 'br':
+            compressed = brotli.compress(body, quality=5)
+        else:
+            compressed = gzip.compress(body, compresslevel=6, mtime=0)  # 固定时间戳，各进程压缩结果一致
+        with self.lock:
+            if key not in self.entries and len(compressed) <= self.max_bytes:
+                self.entries[key] = compressed
+                self.size += len(compressed)
+                while self.size > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.size -= len(evicted)
+        return compressed
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.size, 'hits': self.hits, 'misses': self.misses}
+
+compressed_cache = CompressedBodyCache(int(os.getenv('COMPRESSED_CACHE_BYTES', str(64 * 1024 * 1024))))
+
+# 静态资源：页面和脚本加载到内存，文件修改(mtime或大小变化)后自动重新加载；
+# 超过STATIC_INLINE_MAX的文件不常驻内存，未压缩时用sendfile发送
+STATIC_ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_INLINE_MAX = int(os.getenv('STATIC_INLINE_MAX', str(1024 * 1024)))
+STATIC_EXTENSIONS = ('.html', '.js', '.css', '.png', '.jpg', '.svg', '.ico')
+# 页面中引用的脚本改写为带内容指纹的URL(/assets/<指纹>/<文件名>)，可长期缓存
+FINGERPRINTED_ASSETS = ('vue.global.js', 'axios.min.js', 'chart.min.js')
+# 生产模式(STATIC_PRODUCTION=1)下以压缩版替代开发版，需将对应文件放在程序目录
+PRODUCTION_ASSETS = {'vue.global.js': 'vue.global.prod.js'}
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+class StaticAssetCache:
+    """程序目录下静态文件的内存缓存，每次访问只做一次stat检查文件是否变化"""
+
+    def __init__(self, root, inline_max, production):
+        self.root = root
+        self.inline_max = inline_max
+        self.production = production
+        self.assets = {}  # 文件名 -> 资源信息
+        self.pages = {}  # 页面名 -> (页面ETag及引用资源的指纹, 改写后的页面内容)
+        self.lock = threading.Lock()
+        self.loads = 0
+        if production:
+            for name, alternative in PRODUCTION_ASSETS.items():
+                if not os.path.isfile(os.path.join(root, alternative)):
+                    print(f"生产模式: 未找到{alternative}，继续使用{name}")
+
+    def source_path(self, name):
+        if self.production and name in PRODUCTION_ASSETS:
+            alternative = os.path.join(self.root, PRODUCTION_ASSETS[name])
+            if os.path.isfile(alternative):
+                return alternative
+        return os.path.join(self.root, name)
+
+    def get(self, name):
+        """返回资源信息{path, body, size, etag, content_type}，文件不存在或不允许访问时返回None"""
+        if '/' in name or '\\' in name or name.startswith('.') or not name.endswith(STATIC_EXTENSIONS):
+            return None
+        path = self.source_path(name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        version = (path, stat.st_mtime_ns, stat.st_size)
+        asset = self.assets.get(name)
+        if asset is not None and asset['version'] == version:
+            return asset
+        asset = self.load(name, path, version)
+        with self.lock:
+            self.assets[name] = asset
+            self.loads += 1
+        return asset
+
+    def load(self, name, path, version):
+        digest = hashlib.blake2b(digest_size=16)
+        body = None
+        with open(path, 'rb') as f:
+            if version[2] <= self.inline_max:
+                body = f.read()
+                digest.update(body)
+            else:
+                for block in iter(lambda: f.read(EXPORT_CHUNK_SIZE), b''):
+                    digest.update(block)
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type == 'application/javascript':
+            content_type += '; charset=utf-8'
+        return {
+            'version': version,
+            'path': path,
+            'body': body,
+            'size': version[2],
+            'etag': '"' + digest.hexdigest() + '"',
+            'fingerprint': digest.hexdigest()[:12],
+            'content_type': content_type,
+        }
+
+    def resolve(self, path):
+        """按请求路径查找资源，返回(资源信息, Cache-Control)；/assets/<指纹>/<文件名>在指纹与当前内容一致时可被浏览器永久缓存"""
+        if path.startswith('/assets/'):
+            _, _, fingerprint, name = (path.split('/', 3) + [''])[:4]
+            asset = self.get(name)
+            if asset is not None and asset['fingerprint'] == fingerprint:
+                return asset, IMMUTABLE_CACHE_CONTROL
+            return asset, 'no-cache'
+        return self.get(path.lstrip('/')), 'no-cache'
+
+    def asset_url(self, name):
+        asset = self.get(name)
+        return f"/assets/{asset['fingerprint']}/{name}" if asset else name
+
+    def render_page(self, name):
+        """返回页面内容，其中的脚本引用改写为带指纹的URL；页面或脚本变化后重新生成"""
+        page = self.get(name)
+        if page is None:
+            return None
+        urls = tuple(self.asset_url(asset) for asset in FINGERPRINTED_ASSETS)
+        key = (page['etag'], urls)
+        cached = self.pages.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        content = page['body'] if page['body'] is not None else open(page['path'], 'rb').read()
+        for asset, url in zip(FINGERPRINTED_ASSETS, urls):
+            content = content.replace(f'src="{asset}"'.encode(), f'src="{url}"'.encode())
+        with self.lock:
+            self.pages[name] = (key, content)
+        return content
+
+    def stats(self):
+        with self.lock:
+            return {
+                'production': self.production,
+                'assets': len(self.assets),
+                'bytes': sum(len(asset['body']) for asset in self.assets.values() if asset['body'] is not None),
+                'loads': self.loads,
+            }
+
+static_assets = StaticAssetCache(STATIC_ROOT, STATIC_INLINE_MAX, os.getenv('STATIC_PRODUCTION', '0') == '1')
+
+def conditional_body(body, content_type, if_none_match, accept_encoding, cache_control='no-cache', headers=None, etag=None, size=None):
+    """生成完整响应：带强ETag，If-None-Match匹配时返回304；按Accept-Encoding压缩。
+    body也可以是读取内容的函数（需同时给出etag和size），只在需要时才读取。
+    返回(状态码, 响应头列表, 响应体)，304时响应体为b''"""
+    etag = etag or body_etag(body)
+    size = len(body) if size is None else size
+    encoding = None
+    if size >= MIN_COMPRESS_SIZE and is_compressible(content_type):
+        encoding = choose_encoding(accept_encoding)
+    
+    if etag_matches(if_none_match, etag):
+        return 304, [
+            ('ETag', encoded_etag(etag, encoding)),
+            ('Cache-Control', cache_control),
+            ('Access-Control-Allow-Origin', '*'),
+            ('Vary', 'Accept-Encoding'),
+        ], b''
+    
+    if encoding:
+        body = compressed_cache.get(body, etag, encoding)
+    elif callable(body):
+        body = body()
+    response_headers = [('Content-type', content_type), ('Access-Control-Allow-Origin', '*')]
+    response_headers.extend((headers or {}).items())
+    response_headers += [
+        ('ETag', encoded_etag(etag, encoding)),
+        ('Cache-Control', cache_control),
+        ('Vary', 'Accept-Encoding'),
+    ]
+    if encoding:
+        response_headers.append(('Content-Encoding', encoding))
+    response_headers.append(('Content-Length', str(len(body))))
+    return 200, response_headers, body
+
+def asset_response(asset, cache_control, if_none_match, accept_encoding):
+    """生成静态文件响应，返回(状态码, 响应头列表, 响应体)；响应体为None时应直接从asset['path']发送文件"""
+    if asset['body'] is not None:
+        return conditional_body(asset['body'], asset['content_type'], if_none_match, accept_encoding,
+                                cache_control, etag=asset['etag'])
+    # 大文件：可压缩时使用缓存的压缩结果，否则直接从文件发送
+    encoding = None
+    if is_compressible(asset['content_type']):
+        encoding = choose_encoding(accept_encoding)
+    if encoding or etag_matches(if_none_match, asset['etag']):
+        def read_file():
+            with open(asset['path'], 'rb') as f:
+                return f.read()
+        return conditional_body(read_file, asset['content_type'], if_none_match, accept_encoding,
+                                cache_control, etag=asset['etag'], size=asset['size'])
+    return 200, [
+        ('Content-type', asset['content_type']),
+        ('ETag', asset['etag']),
+        ('Cache-Control', cache_control),
+        ('Vary', 'Accept-Encoding'),
+        ('Content-Length', str(asset['size'])),
+    ], None
+
+# 耗时接口的并发上限，避免大量回收版查询占满线程和数据库连接，影响/api/years和静态文件等轻量请求；
+# 超过上限的请求最多等待ENDPOINT_WAIT秒，仍无空位时返回503；每类最多ENDPOINT_QUEUE个请求等待，
+# 其余立即返回503，避免等待的请求占满请求线程（各类上限与等待数之和应小于SERVER_THREADS）
+ENDPOINT_LIMITS = {
+    name: int(limit)
+    for name, limit in (item.split('=') for item in os.getenv('ENDPOINT_LIMITS', 'report=4,recycling=4,export=2,aggregate=4').split(','))
+}
+ENDPOINT_WAIT = float(os.getenv('ENDPOINT_WAIT', '5'))
+ENDPOINT_QUEUE = int(os.getenv('ENDPOINT_QUEUE', '2'))
+
+def endpoint_class(method, path):
+    """返回请求所属的限流类别，不限流的请求返回None"""
+    if method == 'POST' and path == '/api/report':
+        return 'report'
+    if method != 'GET' or not path.startswith('/api/recycling'):
+        return None
+    if path.startswith('/api/recycling/export'):
+        return 'export'
+    if path.startswith(('/api/recycling/summary', '/api/recycling/facets')):
+        return 'aggregate'
+    return 'recycling'
+
+class EndpointLimiter:
+    """按接口类别限制同时处理的请求数，并统计处理中、等待时间和被拒绝的请求数"""
+
+    def __init__(self, limits, wait, max_waiting):
+        self.limits = limits
+        self.wait = wait
+        self.max_waiting = max_waiting
+        self.slots = {name: threading.BoundedSemaphore(limit) for name, limit in limits.items()}
+        self.lock = threading.Lock()
+        self.counters = {name: {'in_flight': 0, 'waiting': 0, 'admitted': 0, 'rejected': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+                         for name in limits}
+
+    def acquire(self, name, timeout=None):
+        """占用一个名额，timeout秒内（默认ENDPOINT_WAIT）没有空位、或已有max_waiting个请求在等待时返回False"""
+        slots = self.slots.get(name)
+        if slots is None:
+            return True
+        counters = self.counters[name]
+        start = time.monotonic()
+        admitted = slots.acquire(blocking=False)
+        with self.lock:
+            if not admitted and counters['waiting'] >= self.max_waiting:
+                counters['rejected'] += 1
+                return False
+            counters['waiting'] += 1
+        if not admitted:
+            admitted = slots.acquire(timeout=self.wait if timeout is None else timeout)
+        waited = time.monotonic() - start
+        with self.lock:
+            counters['waiting'] -= 1
+            if admitted:
+                counters['in_flight'] += 1
+                counters['admitted'] += 1
+                counters['wait_total'] += waited
+                counters['wait_max'] = max(counters['wait_max'], waited)
+            else:
+                counters['rejected'] += 1
+        return admitted
+
+    def release(self, name):
+        slots = self.slots.get(name)
+        if slots is None:
+            return
+        with self.lock:
+            self.counters[name]['in_flight'] -= 1
+        slots.release()
+
+    def stats(self):
+        with self.lock:
+            return {
+                name: {
+                    'limit': self.limits[name],
+                    'max_waiting': self.max_waiting,
+                    'in_flight': counters['in_flight'],
+                    'waiting': counters['waiting'],
+                    'admitted': counters['admitted'],
+                    'rejected': counters['rejected'],
+                    'avg_wait_ms': round(counters['wait_total'] / counters['admitted'] * 1000, 3) if counters['admitted'] else 0,
+                    'max_wait_ms': round(counters['wait_max'] * 1000, 3),
+                }
+                for name, counters in self.counters.items()
+            }
+
+endpoint_limiter = EndpointLimiter(ENDPOINT_LIMITS, ENDPOINT_WAIT, ENDPOINT_QUEUE)
+
+# 以下为各接口与传输方式无关的处理逻辑，由ReportSystemHandler和ASGI应用(asgi_app.py)共用
+IQC_REPORT_HEADERS = {
+    'Access-Control-Allow-Methods': 'POST, GET, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, If-None-Match',
+    'Access-Control-Expose-Headers': 'ETag',
+}
+RECYCLING_API_HEADERS = {
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+}
+
+def iqc_report_bytes(data):
+    """POST /api/report：按请求参数返回IQC报表JSON字节"""
+    material_type = data.get('material_type')
+    periods = parse_report_periods(data)
+    # 相同参数的并发请求只查询一次数据库
+    if periods:
+        # 多年份或日期区间：一次查询返回所有区间，月份键为YYYY-MM
+        key = ('report', tuple(periods), normalize_material_type(material_type))
+        return request_flight.do(key, lambda: get_iqc_period_report_bytes(periods, material_type))
+    year = int(data.get('year', 2025))
+    key = ('report', year, normalize_material_type(material_type))
+    return request_flight.do(key, lambda: get_iqc_report_bytes(year, material_type))
+
+def recycling_api_response(query_params):
+    """GET /api/recycling：返回(逐段输出的生成器, None)或(None, JSON字节)"""
+    # 处理查询参数
+    filters = parse_recycling_filters(query_params)
+    page = parse_recycling_page(query_params)
+    
+    response_format = query_params.get('format', ['rows'])[0]
+    if response_format not in ('rows', 'columnar'):
+        raise ValueError(f"不支持的数据格式: {response_format}")
+    columnar = response_format == 'columnar'
+    
+    if query_params.get('stream', [''])[0] in ('1', 'true'):
+        if page is not None or columnar:
+            raise ValueError("stream不支持分页参数和列式格式")
+        return iter_recycling_json(filters), None
+    
+    print(f"查询参数: {filters}")
+    
+    # 优先使用后台预热的结果，否则相同筛选条件的并发请求只查询一次数据库
+    key = recycling_response_key(filters, page, response_format)
+    encoded_data = report_warmer.warmed_body(key)
+    if encoded_data is None:
+        encoded_data = request_flight.do(key, lambda: get_recycling_bytes(filters, page, columnar))
+    print(f"响应数据大小: {len(encoded_data)} 字节")
+    return None, encoded_data
+
+def recycling_export_response(query_params):
+    """GET /api/recycling/export：返回(逐段输出的生成器, Content-Type, 附加响应头)"""
+    filters = parse_recycling_filters(query_params)
+    export_format = query_params.get('format', ['xlsx'])[0].lower()
+    if export_format not in RECYCLING_EXPORT_FORMATS:
+        raise ValueError(f"不支持的导出格式: {export_format}")
+    print(f"导出回收版数据: {export_format} {filters}")
+    
+    iter_export, content_type = RECYCLING_EXPORT_FORMATS[export_format]
+    filename = f"回收版使用统计报表_{datetime.now().strftime('%Y-%m-%d')}.{export_format}"
+    return iter_export(filters), content_type, {
+        'Content-Disposition': f"attachment; filename=recycling.{export_format}; filename*=UTF-8''{quote(filename)}",
+    }
+
+def mock_recycling_report(data):
+    """POST /api/recycling/report：生成回收版使用统计数据"""
+    year = data.get('year', 2024)
+    
+    recycling_data = []
+    total_recycled = 0
+    total_used = 0
+    
+    for month in range(1, 13):
+        recycled_count = random.randint(100, 300)
+        used_count = random.randint(80, recycled_count)
+        
+        recycling_data.append({
+            'month': month,
+            'recycled': recycled_count,
+            'used': used_count,
+            'rate': round((used_count / recycled_count) * 100, 2)
+        })
+        
+        total_recycled += recycled_count
+        total_used += used_count
+    
+    return {
+        'data': recycling_data,
+        'total_recycled': total_recycled,
+        'total_used': total_used,
+        'avg_rate': round((total_used / total_recycled) * 100, 2)
+    }
+
+def db_test_result():
+    """测试数据库连接，附带连接池统计"""
+    try:
+        with db_pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute('SELECT 1')
+        result = {'status': 'success', 'message': '数据库连接成功'}
+    except (psycopg2.Error, PoolTimeout) as e:
+        print(f"Database connection failed: {e}")
+        result = {'status': 'error', 'message': '数据库连接失败'}
+    result['pool'] = db_pool.stats()
+    return result
+
+def cache_stats():
+    """报表缓存命中及请求合并统计"""
+    return {
+        'report_cache': report_cache.stats(),
+        'single_flight': request_flight.stats(),
+        'compressed_cache': compressed_cache.stats(),
+        'static_assets': static_assets.stats(),
+        'db_pool': db_pool.stats(),
+        'endpoints': endpoint_limiter.stats(),
+        'request_pool': ThreadedHTTPServer.current.stats() if ThreadedHTTPServer.current else None,
+        'deadlines': deadline_watchdog.stats(),
+    }
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def stats_gauges():
+    """cache_stats()中的各项统计，返回[指标名, [[标签名, 取值], ...], 数值]列表"""
+    stats = cache_stats()
+    gauges = []
+    for section in ('report_cache', 'single_flight', 'compressed_cache', 'static_assets', 'db_pool', 'request_pool'):
+        for key, value in (stats[section] or {}).items():
+            prefix = section if section.startswith('report_') else f'report_{section}'
+            gauges.append([f'{prefix}_{key}', [], value])
+    for endpoint, values in stats['endpoints'].items():
+        for key, value in values.items():
+            gauges.append([f'report_endpoint_{key}', [['endpoint', endpoint]], value])
+    deadlines = stats['deadlines']
+    gauges.append(['report_deadlines_active', [], deadlines['active']])
+    for key in ('timeouts', 'disconnects'):
+        gauges.extend([f'report_deadline_{key}', [['endpoint', endpoint]], value] for endpoint, value in deadlines[key].items())
+    return gauges
+
+# 多进程模式下各工作进程定期把指标快照写入该目录（启动服务时清空），/metrics导出所有工作进程的合计
+METRICS_DIR = os.getenv('METRICS_DIR', os.path.join(REPORT_CACHE_DIR, 'metrics'))
+METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', '5'))
+
+class MetricShards:
+    """跨进程汇总指标：每个工作进程定期把自己的指标快照原子写入共享目录中以进程号和启动时间命名的文件，
+    导出时合并本进程的实时数据和其他进程的快照。已退出进程的counter/histogram快照保留，合计不会因
+    工作进程重启而回退；gauge只取仍在更新快照的进程，并带worker标签区分"""
+
+    def __init__(self, directory, interval):
+        self.directory = directory
+        self.interval = interval
+        self.path = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """在工作进程中调用（fork之后），开始定期写入快照"""
+        if self.thread is not None or self.interval <= 0:
+            return
+        self.path = os.path.join(self.directory, f'{os.getpid()}_{int(time.time() * 1000)}.json')
+        self.thread = threading.Thread(target=self.run, name='metrics-flush', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """停止定期写入，并写入最后一次快照"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.flush()
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        snapshot = {
+            'metrics': {metric.name: [[list(labels), values] for labels, values in metric.collect().items()]
+                        for metric in METRICS},
+            'gauges': stats_gauges(),
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(self.path, json.dumps(snapshot, ensure_ascii=False).encode('utf-8'))
+        except OSError as e:
+            print(f"写入指标快照失败: {e}")
+
+    def others(self):
+        """其他进程的快照，返回[(进程号, 快照, 是否仍在更新)]；未启动快照时只导出本进程"""
+        if self.thread is None:
+            return []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        shards = []
+        now = time.time()
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if not name.endswith('.json') or path == self.path:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    live = now - os.fstat(f.fileno()).st_mtime < 3 * self.interval
+                    shards.append((name.split('_')[0], json.load(f), live))
+            except (OSError, ValueError):
+                continue  # 文件已被清除或正在替换
+        return shards
 
-# Database connection function
-def get_db_connection():
-    try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        return conn
-    except Exception as e:
-        print(f"Database connection failed: {e}")
-        return None
+    def clear(self):
+        """启动服务前删除上次运行留下的快照"""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith('.json'):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+metric_shards = MetricShards(METRICS_DIR, METRICS_FLUSH_INTERVAL)
+
+def render_metrics():
+    """GET /metrics：Prometheus文本格式的请求、数据库及编码指标，以及cache_stats()中各项统计（gauge，带worker标签）。
+    多进程模式下合并各工作进程的快照，任一工作进程都返回全部进程的数据"""
+    shards = metric_shards.others()
+    lines = []
+    for metric in METRICS:
+        totals = metric.collect()
+        for _, snapshot, live in shards:
+            if live or metric.kind != 'gauge':
+                metric.merge(totals, snapshot['metrics'].get(metric.name, []))
+        metric.render(lines, totals)
+    workers = [(str(os.getpid()), stats_gauges())]
+    workers.extend((worker, snapshot['gauges']) for worker, snapshot, live in shards if live)
+    gauges = {}
+    for worker, samples in workers:
+        for name, pairs, value in samples:
+            gauges.setdefault(name, []).append((metric_labels(metric_pairs(pairs + [['worker', worker]])), value))
+    for name, samples in gauges.items():
+        lines.append(f'# TYPE {name} gauge')
+        lines.extend(f'{name}{labels} {float(value)}' for labels, value in samples)
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+class CountingWriter:
+    """包装连接的输出流，累计写出的字节数"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.written = 0
+        self.discard = False  # 为True时丢弃写入的内容（HEAD请求的响应体）
+
+    def write(self, data):
+        if self.discard:
+            return len(data)
+        self.written += len(data)
+        return self.raw.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
 
 class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
-    def send_head(self):
-        # 重写send_head设置HTML文件头
-        path = self.translate_path(self.path)
-        if path.endswith('.html'):
-            # 设置HTML响应头
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
-            with open(path, 'rb') as f:
-                content = f.read()
-                self.send_header('Content-Length', str(len(content)))
-                self.end_headers()
-                return BytesIO(content)
-        return super().send_head()
+    def send_body(self, body, content_type, cache_control='no-cache', headers=None, etag=None, size=None):
+        """发送完整响应：带强ETag，If-None-Match匹配时返回304；按Accept-Encoding压缩（见conditional_body）"""
+        status, response_headers, body = conditional_body(
+            body, content_type, self.headers.get('If-None-Match'), self.headers.get('Accept-Encoding'),
+            cache_control, headers, etag, size)
+        self.send_response(status)
+        for name, value in response_headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def send_static_file(self):
+        """发送程序目录下的静态文件；/assets/<指纹>/<文件名>在指纹与当前内容一致时可被浏览器永久缓存"""
+        asset, cache_control = static_assets.resolve(urlparse(self.path).path)
+        if asset is None:
+            self.send_error(404, 'File not found')
+            return
+        status, headers, body = asset_response(
+            asset, cache_control, self.headers.get('If-None-Match'), self.headers.get('Accept-Encoding'))
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command == 'HEAD':
+            return
+        if body is None:
+            # 大文件未压缩时用sendfile直接从文件发送
+            with open(asset['path'], 'rb') as f:
+                self.wfile.written += self.connection.sendfile(f, 0, asset['size'])
+        elif body:
+            self.wfile.write(body)
+
+    def setup(self):
+        super().setup()
+        self.wfile = CountingWriter(self.wfile)
+
+    def send_response(self, code, message=None):
+        self.status_code = code
+        super().send_response(code, message)
+
+    def end_headers(self):
+        super().end_headers()
+        self.body_start = self.wfile.written
+        # HEAD请求与GET走同一路由，只发送响应头
+        self.wfile.discard = self.command == 'HEAD'
+
     def do_GET(self):
+        self.measure(self.route_get)
+
+    def do_HEAD(self):
+        self.measure(self.route_get)
+
+    def do_POST(self):
+        self.measure(self.route_post)
+
+    def measure(self, route):
+        """记录请求耗时、状态码和响应体字节数（/metrics）"""
+        label = route_label(urlparse(self.path).path)
+        self.status_code = 0
+        self.body_start = None
+        self.wfile.discard = False
+        http_in_flight.inc(1, label)
+        start = time.perf_counter()
+        try:
+            self.admit(route)
+        finally:
+            http_in_flight.inc(-1, label)
+            body_bytes = self.wfile.written - self.body_start if self.body_start is not None else 0
+            observe_request(label, self.command, self.status_code, time.perf_counter() - start, body_bytes)
+
+    def admit(self, route):
+        """耗时接口先占用该类接口的并发名额，等待超时返回503"""
+        name = endpoint_class(self.command, urlparse(self.path).path)
+        if name is None:
+            route()
+            return
+        if not endpoint_limiter.acquire(name):
+            self.send_overloaded()
+            return
+        deadline = RequestDeadline(name, ENDPOINT_DEADLINES[name], self.client_disconnected) if name in ENDPOINT_DEADLINES else None
+        token = request_deadline.set(deadline)
+        if deadline is not None:
+            deadline_watchdog.register(deadline)
+        try:
+            route()
+        finally:
+            if deadline is not None:
+                deadline_watchdog.unregister(deadline)
+            request_deadline.reset(token)
+            endpoint_limiter.release(name)
+
+    def client_disconnected(self):
+        """请求已读完后连接变为可读且读不到数据，说明客户端已关闭连接（由后台线程调用）"""
+        try:
+            readable, _, _ = select.select([self.connection], [], [], 0)
+            return bool(readable) and self.connection.recv(1, socket.MSG_PEEK) == b''
+        except (OSError, ValueError):
+            return True
+
+    def send_overloaded(self):
+        body = overloaded_body()
+        self.send_response(503)
+        self.send_header('Content-type', 'application/json; charset=utf-8')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Retry-After', RETRY_AFTER)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def route_get(self):
         # 记录静态文件请求
-        if not self.path.startswith('/api/'):
+        if not self.path.startswith('/api/') and self.path != '/metrics':
             print(f"Serving static file: {self.path}")
         if self.path == '/@vite/client':
             # 处理Vite客户端请求，避免404错误
@@ -60,95 +2608,13 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
             return
         elif self.path == '/':
             # 返回报表系统入口页面
-            try:
-                with open('index.html', 'r', encoding='utf-8') as f:
-                    content = f.read()
-                encoded_content = content.encode('utf-8')
-                content_length = len(encoded_content)
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html; charset=utf-8')
-                self.send_header('Content-Length', str(content_length))
-                self.end_headers()
-                self.wfile.write(encoded_content)
-            except FileNotFoundError:
-                self.send_response(404)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write('<h1>404 - 页面未找到</h1>'.encode('utf-8'))
+            self.send_page('index.html')
         elif self.path.startswith('/iqc'):
-                # 返回IQC缺陷分析页面
-                import time
-                start_time = time.time()
-                try:
-                    self.log_message(f'Start serving iqc.html at {start_time}')
-                    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'iqc.html')
-                    with open(file_path, 'rb') as f:
-                        encoded_content = f.read()
-                    read_time = time.time()
-                    self.log_message(f'Finished reading iqc.html in {read_time - start_time:.4f}s')
-                    content_length = len(encoded_content)
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/html; charset=utf-8')
-                    self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                    self.send_header('Pragma', 'no-cache')
-                    self.send_header('Expires', '0')
-                    self.send_header('Content-Length', str(content_length))
-                    self.end_headers()
-                    header_time = time.time()
-                    self.log_message(f'Headers sent for iqc.html in {header_time - read_time:.4f}s')
-                    bytes_written = self.wfile.write(encoded_content)
-                    write_time = time.time()
-                    self.log_message(f'Completed serving iqc.html in {write_time - start_time:.4f}s (total bytes: {content_length}, bytes written: {bytes_written})')
-                except FileNotFoundError:
-                    error_time = time.time()
-                    self.log_message(f'File not found error serving iqc.html after {error_time - start_time:.4f}s')
-                    self.send_response(404)
-                    self.send_header('Content-type', 'text/html')
-                except Exception as e:
-                    error_time = time.time()
-                    self.log_message(f'Error serving iqc.html after {error_time - start_time:.4f}s: {str(e)}')
-                    self.send_response(500)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    self.wfile.write(f'<h1>500 - 服务器内部错误: {str(e)}</h1>'.encode('utf-8'))
+            # 返回IQC缺陷分析页面
+            self.send_page('iqc.html')
         elif self.path == '/recycling.html':
-                # 返回回收版使用统计报表页面
-                import time
-                start_time = time.time()
-                try:
-                    self.log_message(f'Start serving recycling.html at {start_time}')
-                    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recycling.html')
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
-                    read_time = time.time()
-                    self.log_message(f'Finished reading recycling.html in {read_time - start_time:.4f}s')
-                    content_length = len(content)
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/html; charset=utf-8')
-                    self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                    self.send_header('Pragma', 'no-cache')
-                    self.send_header('Expires', '0')
-                    self.send_header('Content-Length', str(content_length))
-                    self.end_headers()
-                    header_time = time.time()
-                    self.log_message(f'Headers sent for recycling.html in {header_time - read_time:.4f}s')
-                    bytes_written = self.wfile.write(content)
-                    write_time = time.time()
-                    self.log_message(f'Completed serving recycling.html in {write_time - start_time:.4f}s (total bytes: {content_length}, bytes written: {bytes_written})')
-                except FileNotFoundError:
-                    error_time = time.time()
-                    self.log_message(f'File not found error serving recycling.html after {error_time - start_time:.4f}s')
-                    self.send_response(404)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    self.wfile.write('<h1>404 - IQC报表页面未找到</h1>'.encode('utf-8'))
-                except Exception as e:
-                    error_time = time.time()
-                    self.log_message(f'Error serving recycling.html after {error_time - start_time:.4f}s: {str(e)}')
-                    self.send_response(500)
-                    self.send_header('Content-type', 'text/html')
-                    self.end_headers()
-                    self.wfile.write(f'<h1>500 - 服务器内部错误: {str(e)}</h1>'.encode('utf-8'))
+            # 返回回收版使用统计报表页面
+            self.send_page('recycling.html')
         elif self.path.startswith('/recycling'):
             # 返回服务版使用统计报表页面
             if self.path == '/recycling' or 'recycling?' in self.path:
@@ -156,27 +2622,61 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
             elif self.path.startswith('/api/recycling'):
                 self.handle_recycling_api()
             else:
-                super().do_GET()
+                self.send_static_file()
         elif self.path == '/api/years':
-            response = {'years': [2025, 2024, 2023, 2022]}
-            response_data = json.dumps(response).encode()
-            content_length = len(response_data)
+            # 可用年份来自lot表出货时间，附带月份跨度和各年份lot数
+            try:
+                response_data = get_years_bytes()
+            except Exception as e:
+                self.send_response(500)
+                self.send_header('Content-type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(json.dumps({'error': str(e)}).encode())
+                return
+            self.send_body(response_data, 'application/json')
+        elif self.path.startswith('/api/recycling/export'):
+            self.handle_recycling_export()
+        elif self.path.startswith('/api/recycling/summary'):
+            self.handle_recycling_aggregate(get_recycling_summary_bytes)
+        elif self.path.startswith('/api/recycling/facets'):
+            self.handle_recycling_aggregate(get_recycling_facets_bytes)
+        elif self.path.startswith('/api/recycling'):
+            self.handle_recycling_api()
+        elif self.path == '/api/cache/stats':
+            # 报表缓存命中及请求合并统计
+            response_data = json.dumps(cache_stats()).encode()
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
             self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Content-Length', str(content_length))
+            self.send_header('Content-Length', str(len(response_data)))
+            self.end_headers()
+            self.wfile.write(response_data)
+        elif self.path == '/metrics':
+            # Prometheus指标
+            response_data = render_metrics()
+            self.send_response(200)
+            self.send_header('Content-type', METRICS_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(response_data)))
+            self.end_headers()
+            self.wfile.write(response_data)
+        elif self.path == '/api/warmer/status':
+            # 后台预热任务状态：最近运行时间、耗时和行数
+            response_data = json.dumps(report_warmer.stats()).encode()
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Content-Length', str(len(response_data)))
             self.end_headers()
             self.wfile.write(response_data)
-        elif self.path.startswith('/api/recycling'):
-            self.handle_recycling_api()
         elif self.path == '/api/db-test':
             # 测试数据库连接
             self.test_db_connection()
         else:
             # 处理其他静态文件
-            super().do_GET()
+            self.send_static_file()
     
-    def do_POST(self):
+    def route_post(self):
         if self.path == '/api/report':
             self.handle_iqc_report()
         elif self.path == '/api/recycling/report':
@@ -192,284 +2692,18 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
         post_data = self.rfile.read(content_length)
         
         try:
-            data = json.loads(post_data.decode())
-            year = data.get('year', 2025)
-            
-            # 连接数据库获取真实数据
-            conn = get_db_connection()
-            if not conn:
-                raise Exception("数据库连接失败")
-            
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-            # 执行SQL查询，按年份筛选
-            sql = """
-                SELECT 
-                    DATE_TRUNC('month', l.event_time) AS month,  -- 按月份截断时间
-                    CASE WHEN cd.vendor IS NULL THEN 'Unknown' ELSE cd.vendor END AS vendor,  -- 供应商字段，保持原始供应商名称，NULL值转换为'Unknown'
-                    CASE 
-                        WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '02' THEN 'Quartz'
-                        WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '01' THEN 'Soda'
-                        ELSE 'Other'  -- 如果不是01或02，可以归类为Other或其他默认值
-                    END AS material_type,  -- 区分Quartz和Soda
-                    COUNT(l.lot_name) AS shipped_lot_count,  -- 统计当月lot_name的个数作为实际生产数量
-                    ROUND(AVG(
-                        (SELECT COUNT(aafi.sno)::float
-                         FROM analyze_aoi_field_item aafi
-                         LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id
-                         WHERE aafi.kind IN ('A1','A2','A3','A4')
-                         AND aaf.process_flow_seq_name = 'C4010'
-                         AND aaf.order_no = l.lot_name)
-                    )::numeric, 3) AS avg_black,  -- 计算black的平均值
-                    ROUND(AVG(
-                        (SELECT COUNT(aafi.sno)::float
-                         FROM analyze_aoi_field_item aafi
-                         LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id
-                         WHERE aafi.kind IN ('B1','B2','B3','B4')
-                         AND aaf.process_flow_seq_name = 'C4010'
-                         AND aaf.order_no = l.lot_name)
-                    )::numeric, 3) AS avg_white   -- 计算white的平均值
-                FROM lot l
-                LEFT JOIN consumable_def cd ON l.material_def_id = cd.consumable_def_name  -- 添加关联条件
-                WHERE l.lot_state = 'Shipped'
-                    AND EXTRACT(YEAR FROM l.event_time) = %s
-                GROUP BY DATE_TRUNC('month', l.event_time), CASE WHEN cd.vendor IS NULL THEN 'Unknown' ELSE cd.vendor END,
-                         CASE 
-                             WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '02' THEN 'Quartz'
-                             WHEN SUBSTRING(cd.consumable_def_name FROM 4 FOR 2) = '01' THEN 'Soda'
-                             ELSE 'Other'
-                         END;  -- 按月份、vendor和material_type分组
-            """
-            cur.execute(sql, (year,))
-            results = cur.fetchall()
-            # 打印查询结果的前几行，用于调试lot表结构
-            print(f"查询结果前2行: {results[:2]}")
-            conn.close()
-            
-            # 处理查询结果，按材料类型和供应商分组
-            material_data = {
-                'Quartz': {},
-                'Soda': {},
-                'Other': {}
-            }
-            
-            # 收集所有供应商
-            vendors = set()
-            
-            for row in results:
-                month = row['month'].month  # 提取月份
-                material_type = row['material_type']
-                vendor = row['vendor']
-                vendors.add(vendor)
-                
-                # 初始化该材料类型和月份的供应商数据
-                if month not in material_data[material_type]:
-                    material_data[material_type][month] = {
-                        'month': month,
-                        'production': 0,
-                        'white_defect': 0.0,
-                        'black_defect': 0.0,
-                        'vendors': {}
-                    }
-                
-                # 初始化供应商数据
-                if vendor not in material_data[material_type][month]['vendors']:
-                    material_data[material_type][month]['vendors'][vendor] = {
-                        'production': 0,
-                        'white_defect': 0.0,
-                        'black_defect': 0.0
-                    }
-                
-                # 累加供应商数据
-                material_data[material_type][month]['vendors'][vendor]['production'] += float(row['shipped_lot_count'])
-                material_data[material_type][month]['vendors'][vendor]['white_defect'] += float(row['avg_white'])
-                material_data[material_type][month]['vendors'][vendor]['black_defect'] += float(row['avg_black'])
-                
-                # 累加总数据
-                material_data[material_type][month]['production'] += float(row['shipped_lot_count'])
-                material_data[material_type][month]['white_defect'] += float(row['avg_white'])
-                material_data[material_type][month]['black_defect'] += float(row['avg_black'])
-            
-            # 转换供应商集合为列表
-            vendors = sorted(list(vendors))
-            
-            # 准备返回数据
-            report_data = {
-                'vendors': vendors,  # 所有供应商列表
-                'quartz': {
-                    'monthly_data': [],
-                    'avg_production': 0,
-                    'avg_white_defect': 0,
-                    'avg_black_defect': 0
-                },
-                'soda': {
-                    'monthly_data': [],
-                    'avg_production': 0,
-                    'avg_white_defect': 0,
-                    'avg_black_defect': 0
-                }
-            }
-            
-            # 处理Quartz数据
-            total_quartz_production = 0
-            total_quartz_white = 0
-            total_quartz_black = 0
-            
-            for month in range(1, 13):
-                if month in material_data['Quartz']:
-                    data = material_data['Quartz'][month].copy()
-                    # 按生产数量加权平均计算缺陷值
-                    total_production = data['production']
-                    data['white_defect'] = round(data['white_defect'] / total_production, 2) if total_production > 0 else 0
-                    data['black_defect'] = round(data['black_defect'] / total_production, 2) if total_production > 0 else 0
-                    report_data['quartz']['monthly_data'].append(data)
-                    total_quartz_production += data['production']
-                    total_quartz_white += data['white_defect']
-                    total_quartz_black += data['black_defect']
-                else:
-                    report_data['quartz']['monthly_data'].append({
-                        'month': month,
-                        'production': 0,
-                        'white_defect': 0,
-                        'black_defect': 0,
-                        'vendors': {}
-                    })
-            
-            # 计算Quartz平均值（按实际有数据的月份数平均）
-            quartz_month_count = sum(1 for data in report_data['quartz']['monthly_data'] if data['production'] > 0 or data['white_defect'] > 0 or data['black_defect'] > 0)
-            report_data['quartz']['avg_production'] = round(total_quartz_production / quartz_month_count) if total_quartz_production and quartz_month_count > 0 else 0
-            report_data['quartz']['avg_white_defect'] = round(total_quartz_white / quartz_month_count, 2) if total_quartz_white and quartz_month_count > 0 else 0
-            report_data['quartz']['avg_black_defect'] = round(total_quartz_black / quartz_month_count, 2) if total_quartz_black and quartz_month_count > 0 else 0
-            
-            # 添加供应商详细数据
-            report_data['quartz']['vendor_data'] = {}
-            # 为每个供应商计算平均值
-            report_data['quartz']['vendor_averages'] = {}
-            for vendor in vendors:
-                report_data['quartz']['vendor_data'][vendor] = []
-                vendor_total_production = 0
-                vendor_total_white = 0
-                vendor_total_black = 0
-                vendor_month_count = 0
-                
-                for month in range(1, 13):
-                    if month in material_data['Quartz'] and vendor in material_data['Quartz'][month]['vendors']:
-                        vendor_data = material_data['Quartz'][month]['vendors'][vendor]
-                        report_data['quartz']['vendor_data'][vendor].append({
-                            'month': month,
-                            'production': vendor_data['production'],
-                            'white_defect': vendor_data['white_defect'],
-                            'black_defect': vendor_data['black_defect']
-                        })
-                        if vendor_data['production'] > 0:
-                            vendor_total_production += vendor_data['production']
-                            vendor_total_white += vendor_data['white_defect']
-                            vendor_total_black += vendor_data['black_defect']
-                            vendor_month_count += 1
-                    else:
-                        report_data['quartz']['vendor_data'][vendor].append({
-                            'month': month,
-                            'production': 0,
-                            'white_defect': 0,
-                            'black_defect': 0
-                        })
-                
-                # 添加调试日志
-                print(f"供应商: {vendor}")
-                print(f"总生产数: {vendor_total_production}")
-                print(f"有效月份数: {vendor_month_count}")
-                print(f"平均生产数: {vendor_total_production / vendor_month_count if vendor_total_production and vendor_month_count > 0 else 0}")
-                
-                # 计算该供应商的平均值
-                report_data['quartz']['vendor_averages'][vendor] = {
-                    'avg_production': round(vendor_total_production / vendor_month_count) if vendor_total_production and vendor_month_count > 0 else 0,
-                    'avg_white_defect': round(vendor_total_white / vendor_month_count, 2) if vendor_total_white and vendor_month_count > 0 else 0,
-                    'avg_black_defect': round(vendor_total_black / vendor_month_count, 2) if vendor_total_black and vendor_month_count > 0 else 0
-                }
-            
-            # 处理Soda数据
-            total_soda_production = 0
-            total_soda_white = 0
-            total_soda_black = 0
-            
-            for month in range(1, 13):
-                if month in material_data['Soda']:
-                    data = material_data['Soda'][month].copy()
-                    # 按生产数量加权平均计算缺陷值
-                    total_production = data['production']
-                    data['white_defect'] = round(data['white_defect'] / total_production, 2) if total_production > 0 else 0
-                    data['black_defect'] = round(data['black_defect'] / total_production, 2) if total_production > 0 else 0
-                    report_data['soda']['monthly_data'].append(data)
-                    total_soda_production += data['production']
-                    total_soda_white += data['white_defect']
-                    total_soda_black += data['black_defect']
-                else:
-                    report_data['soda']['monthly_data'].append({
-                        'month': month,
-                        'production': 0,
-                        'white_defect': 0,
-                        'black_defect': 0,
-                        'vendors': {}
-                    })
-            
-            # 计算Soda平均值（按实际有数据的月份数平均）
-            soda_month_count = sum(1 for data in report_data['soda']['monthly_data'] if data['production'] > 0 or data['white_defect'] > 0 or data['black_defect'] > 0)
-            report_data['soda']['avg_production'] = round(total_soda_production / soda_month_count) if total_soda_production and soda_month_count > 0 else 0
-            report_data['soda']['avg_white_defect'] = round(total_soda_white / soda_month_count, 2) if total_soda_white and soda_month_count > 0 else 0
-            report_data['soda']['avg_black_defect'] = round(total_soda_black / soda_month_count, 2) if total_soda_black and soda_month_count > 0 else 0
-            
-            # 添加供应商详细数据
-            report_data['soda']['vendor_data'] = {}
-            # 为每个供应商计算平均值
-            report_data['soda']['vendor_averages'] = {}
-            for vendor in vendors:
-                report_data['soda']['vendor_data'][vendor] = []
-                vendor_total_production = 0
-                vendor_total_white = 0
-                vendor_total_black = 0
-                vendor_month_count = 0
-                
-                for month in range(1, 13):
-                    if month in material_data['Soda'] and vendor in material_data['Soda'][month]['vendors']:
-                        vendor_data = material_data['Soda'][month]['vendors'][vendor]
-                        report_data['soda']['vendor_data'][vendor].append({
-                            'month': month,
-                            'production': vendor_data['production'],
-                            'white_defect': vendor_data['white_defect'],
-                            'black_defect': vendor_data['black_defect']
-                        })
-                        vendor_total_production += vendor_data['production']
-                        vendor_total_white += vendor_data['white_defect']
-                        vendor_total_black += vendor_data['black_defect']
-                        vendor_month_count += 1
-                    else:
-                        report_data['soda']['vendor_data'][vendor].append({
-                            'month': month,
-                            'production': 0,
-                            'white_defect': 0,
-                            'black_defect': 0
-                        })
-                
-                # 计算该供应商的平均值
-                report_data['soda']['vendor_averages'][vendor] = {
-                    'avg_production': round(vendor_total_production / vendor_month_count) if vendor_total_production and vendor_month_count > 0 else 0,
-                    'avg_white_defect': round(vendor_total_white / vendor_month_count, 2) if vendor_total_white and vendor_month_count > 0 else 0,
-                    'avg_black_defect': round(vendor_total_black / vendor_month_count, 2) if vendor_total_black and vendor_month_count > 0 else 0
-                }
+            response_data = iqc_report_bytes(json.loads(post_data.decode()))
+            # 报表未变化时客户端可带If-None-Match，得到304而无需重新下载
+            self.send_body(response_data, 'application/json', headers=IQC_REPORT_HEADERS)
             
-            # 可以选择是否包含Other类型的数据
-            # report_data['other'] = {...}
-            
-            response_data = json.dumps(report_data).encode()
-            content_length = len(response_data)
-            self.send_response(200)
+        except ClientDisconnected:
+            print("客户端已断开，已取消查询")
+        except TimeoutError as e:
+            self.send_response(504)
             self.send_header('Content-type', 'application/json')
             self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'POST, GET, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-            self.send_header('Content-Length', str(content_length))
             self.end_headers()
-            self.wfile.write(response_data)
-            
+            self.wfile.write(json.dumps({'error': str(e)}).encode())
         except Exception as e:
             self.send_response(400)
             self.send_header('Content-type', 'application/json')
@@ -482,34 +2716,7 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
         post_data = self.rfile.read(content_length)
         
         try:
-            data = json.loads(post_data.decode())
-            year = data.get('year', 2024)
-            
-            # 生成回收版使用统计数据
-            recycling_data = []
-            total_recycled = 0
-            total_used = 0
-            
-            for month in range(1, 13):
-                recycled_count = random.randint(100, 300)
-                used_count = random.randint(80, recycled_count)
-                
-                recycling_data.append({
-                    'month': month,
-                    'recycled': recycled_count,
-                    'used': used_count,
-                    'rate': round((used_count / recycled_count) * 100, 2)
-                })
-                
-                total_recycled += recycled_count
-                total_used += used_count
-            
-            report_data = {
-                'data': recycling_data,
-                'total_recycled': total_recycled,
-                'total_used': total_used,
-                'avg_rate': round((total_used / total_recycled) * 100, 2)
-            }
+            report_data = mock_recycling_report(json.loads(post_data.decode()))
             
             response_data = json.dumps(report_data).encode()
             content_length = len(response_data)
@@ -532,12 +2739,7 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
     def test_db_connection(self):
         """测试数据库连接"""
         try:
-            conn = get_db_connection()
-            if conn:
-                conn.close()
-                result = {'status': 'success', 'message': '数据库连接成功'}
-            else:
-                result = {'status': 'error', 'message': '数据库连接失败'}
+            result = db_test_result()
                 
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
@@ -556,50 +2758,22 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
         try:
             print("收到回收版报表API请求")
             
-            # 解析查询参数
-            parsed_url = urlparse(self.path)
-            query_params = {}
-            if parsed_url.query:
-                from urllib.parse import parse_qs
-                query_params = parse_qs(parsed_url.query)
-            
-            # 处理查询参数
-            filters = {}
-            if 'customer' in query_params:
-                filters['customer'] = query_params['customer'][0]
-            if 'supplier' in query_params:
-                filters['supplier'] = query_params['supplier'][0]
-            if 'orderType' in query_params:
-                filters['orderType'] = query_params['orderType'][0]
-            if 'year' in query_params:
-                filters['year'] = int(query_params['year'][0])
-            
-            print(f"查询参数: {filters}")
-            
-            # 强制使用真实数据，不再回退到模拟数据
-            try:
-                report_data = self.get_real_recycling_data(filters)
-                print("成功获取真实数据库数据")
-            except Exception as e:
-                print(f"获取真实数据失败: {e}")
-                raise e
-            
-            print(f"获取到数据: {len(report_data.get('data', []))} 条记录")
+            from urllib.parse import parse_qs
+            chunks, encoded_data = recycling_api_response(parse_qs(urlparse(self.path).query))
+            if chunks is not None:
+                self.send_chunked(chunks, 'application/json; charset=utf-8')
+                return
+            self.send_body(encoded_data, 'application/json; charset=utf-8', headers=RECYCLING_API_HEADERS)
+            print("响应发送完成")
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json; charset=utf-8')
+        except ClientDisconnected:
+            print("客户端已断开，已取消查询")
+        except TimeoutError as e:
+            self.send_response(504)
+            self.send_header('Content-type', 'application/json')
             self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
             self.end_headers()
-            response_data = json.dumps(report_data, ensure_ascii=False, default=str)
-            encoded_data = response_data.encode('utf-8')
-            content_length = len(encoded_data)
-            self.send_header('Content-Length', str(content_length))
-            print(f"响应数据大小: {content_length} 字节")
-            self.wfile.write(encoded_data)
-            print("响应发送完成")
-            
+            self.wfile.write(json.dumps({'error': str(e)}).encode())
         except Exception as e:
             print(f"处理请求时发生错误: {str(e)}")
             import traceback
@@ -610,178 +2784,90 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(json.dumps({'error': str(e)}).encode())
 
-    def get_real_recycling_data(self, filters):
-        """从10.10.102.129数据库获取真实的服务版使用统计报表数据"""
-        # 强制使用真实数据库配置
-        db_config = {
-            'host': '10.10.102.129',
-            'port': 5432,
-            'database': 'mes_qingyi',
-            'user': 'mes_qingyi',
-            'password': 'mes_qingyi'
-        }
-        
+    def handle_recycling_export(self):
+        """按筛选条件导出回收版数据为xlsx或csv文件，数据从服务端游标流式写出"""
         try:
-            print(f"正在连接数据库: {db_config['host']}/{db_config['database']}")
-            # 建立数据库连接
-            conn = psycopg2.connect(**db_config)
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-            
-            # 构建SQL查询 - 从真实mes_qingyi数据库查询
-            sql_query = """
-            SELECT 
-                l.customer_name,
-                l.lot_name,
-                l.model_id,
-                (CASE 
-                    WHEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') <> '' 
-                     AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') <> '' 
-                    THEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') || '/' || (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022')
-                    WHEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020') <> '' 
-                    THEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2020')
-                    WHEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') IS NOT NULL AND (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022') <> '' 
-                    THEN (SELECT equipment_name FROM lot_engineer_setting les WHERE les.lot_name = l.lot_name AND les.process_seq_name = 'A2022')
-                    ELSE NULL 
-                 END) AS equipment,
-                l.cd,
-                l.process_layer,
-                (CASE 
-                WHEN ((SELECT htm_no from erp_cam_design_param ecdp where ecdp.lot_name = l.lot_name order by ecdp.htm_no desc limit 1) = 2 )
-                THEN CONCAT(
-                    TO_CHAR((SELECT event_time FROM lot_history lh WHERE lh.lot_name = l.lot_name AND lh.process_seq_name = 'A2020' and lh.lot_process_state = 'Run' order by lh.event_time limit 1), 'YYYY-MM-DD HH24:MI:SS'),
-                    ';',
-                    TO_CHAR((SELECT event_time FROM lot_history lh WHERE lh.lot_name = l.lot_name AND lh.process_seq_name = 'A2022' and lh.lot_process_state = 'Run' order by lh.event_time limit 1), 'YYYY-MM-DD HH24:MI:SS')
-                )
-                ELSE TO_CHAR((SELECT event_time FROM lot_history lh WHERE lh.lot_name = l.lot_name AND lh.process_seq_name = 'A2020' and lh.lot_process_state = 'Run' order by lh.event_time limit 1), 'YYYY-MM-DD HH24:MI:SS')
-             END) AS locktime,
-                l.material_id,
-                cd.vendor,
-                l.lot_type,
-                l.product_size as product_size,
-				(CASE 
-        		WHEN ((SELECT htm_no FROM erp_cam_design_param ecdp WHERE ecdp.lot_name = l.lot_name ORDER BY ecdp.htm_no DESC LIMIT 1) = 2)
-        		THEN 
-           		 (SELECT count(aafi.sno)::text 
-           	 	 FROM analyze_aoi_field_item aafi 
-            	 LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
-            	 WHERE aafi.kind IN ('A1','A2','A3','A4') 
-            	   AND aaf.process_flow_seq_name = 'C4010' 
-            	   AND l.lot_name = aaf.order_no)
-          	  || ';' || 
-          	  (SELECT count(aafi.sno)::text 
-            	 FROM analyze_aoi_field_item aafi 
-           	  LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
-           	  WHERE aafi.kind IN ('A1','A2','A3','A4') 
-            	   AND aaf.process_flow_seq_name = 'C4017' 
-            	   AND l.lot_name = aaf.order_no)
-       		 ELSE 
-            (SELECT count(aafi.sno)::text 
-             FROM analyze_aoi_field_item aafi 
-             LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
-             WHERE aafi.kind IN ('A1','A2','A3','A4') 
-               AND aaf.process_flow_seq_name = 'C4010' 
-               AND l.lot_name = aaf.order_no)
-    		END) AS black,
-            	(CASE 
-        		WHEN ((SELECT htm_no FROM erp_cam_design_param ecdp WHERE ecdp.lot_name = l.lot_name ORDER BY ecdp.htm_no DESC LIMIT 1) = 2)
-        		THEN 
-           		 (SELECT count(aafi.sno)::text 
-           	 	 FROM analyze_aoi_field_item aafi 
-            	 LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
-            	 WHERE aafi.kind IN ('B1','B2','B3','B4') 
-            	   AND aaf.process_flow_seq_name = 'C4010' 
-            	   AND l.lot_name = aaf.order_no)
-          	  || ';' || 
-          	  (SELECT count(aafi.sno)::text 
-            	 FROM analyze_aoi_field_item aafi 
-           	  LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
-           	  WHERE aafi.kind IN ('B1','B2','B3','B4') 
-            	   AND aaf.process_flow_seq_name = 'C4017' 
-            	   AND l.lot_name = aaf.order_no)
-       		 ELSE 
-            (SELECT count(aafi.sno)::text 
-             FROM analyze_aoi_field_item aafi 
-             LEFT JOIN analyze_aoi_field aaf ON aaf.id = aafi.af_id 
-             WHERE aafi.kind IN ('B1','B2','B3','B4') 
-               AND aaf.process_flow_seq_name = 'C4010' 
-               AND l.lot_name = aaf.order_no)
-    		END)  AS white,
-                l.event_time as repairtime,
-                l.product_type
-            FROM 
-                lot l 
-                INNER JOIN consumable_def cd ON l.material_def_id = cd.consumable_def_name
-            WHERE 
-                cd.description LIKE 'R%%'
-                AND cd.consumable_type = '主原材料'
-                AND l.material_id IS NOT NULL
-                AND l.lot_name IS NOT NULL
-                AND l.lot_name != ''
-                AND EXTRACT(YEAR FROM l.event_time) = %s
-            ORDER BY locktime desc
-            """
-            
-            # 添加年份过滤条件
-            params = [year]
-            
-            # 添加额外WHERE子句
-            conditions = []
-            
-            if conditions:
-                sql_query += " AND " + " AND ".join(conditions)
-            
-            # 执行查询
-            cur.execute(sql_query, params)
-            rows = cur.fetchall()
-            
-            # 处理查询结果
-            data = []
-            for row in rows:
-                try:
-                    row_dict = dict(row)
-                    data.append({
-                        'customer': str(row_dict.get('customer_name', '') or ''),
-                        'processNumber': str(row_dict.get('lot_name', '') or ''),
-                        'model': str(row_dict.get('model_id', '') or ''),
-                        'equipment': str(row_dict.get('equipment', '') or ''),
-                        'cd': str(row_dict.get('cd', '') or ''),
-                        'layer': str(row_dict.get('process_layer', '') or ''),
-                        'lockTime': str(row_dict.get('locktime', '') or '') ,
-                        'batchNumber': str(row_dict.get('material_id', '') or ''),
-                        'supplier': str(row_dict.get('vendor', '') or ''),
-                        'orderType': str(row_dict.get('lot_type', '') or ''),
-                        'size': str(row_dict.get('product_size', '0')) + 'mm',
-                        'blackDefect': str(row_dict.get('black', '') or ''),
-                        'whiteDefect': str(row_dict.get('white', '') or ''),
-                        'repairTime': 0,
-                        'judgeType': '',
-                        'glassSource': '',
-                        'polishSupplier': '',
-                        'chromeSupplier': '',
-                        'glueSupplier': '',
-                        'recycleStatus': '',
-                        'reprocessPlan': '',
-                        'recycleBatch':  '',
-                        'factory': 'FS',
-                        'year': int(row_dict.get('create_date').year) if row_dict.get('create_date') else datetime.now().year
-                    })
-                except Exception as e:
-                    print(f"处理行数据时出错: {e}")
-                    continue
-            
-            # 关闭数据库连接
-            cur.close()
-            conn.close()
+            from urllib.parse import parse_qs
+            chunks, content_type, headers = recycling_export_response(parse_qs(urlparse(self.path).query))
+            self.send_chunked(chunks, content_type, headers)
+        except ClientDisconnected:
+            print("客户端已断开，已取消查询")
+        except TimeoutError as e:
+            self.send_response(504)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': str(e)}).encode())
+        except Exception as e:
+            print(f"导出失败: {str(e)}")
+            self.send_response(400)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': str(e)}).encode())
+
+    def handle_recycling_aggregate(self, get_bytes):
+        """回收版汇总(summary)和筛选项(facets)接口：按筛选条件返回缓存的聚合结果，不返回明细数据"""
+        try:
+            from urllib.parse import parse_qs
+            filters = parse_recycling_filters(parse_qs(urlparse(self.path).query))
+            response_data = get_bytes(filters)
+        except ClientDisconnected:
+            print("客户端已断开，已取消查询")
+            return
+        except TimeoutError as e:
+            self.send_response(504)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            return
+        except Exception as e:
+            print(f"获取回收版聚合数据失败: {str(e)}")
+            self.send_response(400)
+            self.send_header('Content-type', 'application/json')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            return
+        self.send_body(response_data, 'application/json; charset=utf-8')
+
+    def send_chunked(self, chunks, content_type, headers=None):
+        """以chunked传输编码逐段发送响应，首段生成后才发送响应头，生成出错时仍可返回错误状态"""
+        try:
+            first_chunk = next(chunks)
             
-            return {
-                'data': data,
-                'total': len(data),
-                'filters': filters
-            }
+            # chunked编码需要HTTP/1.1响应，输出完毕后关闭连接
+            self.protocol_version = 'HTTP/1.1'
+            self.close_connection = True
+            self.send_response(200)
+            self.send_header('Content-type', content_type)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.send_header('Connection', 'close')
+            self.end_headers()
             
-        except Exception as e:
-                print(f"获取真实数据失败: {e}")
-                raise e  # 不再回退到模拟数据，直接抛出异常
+            try:
+                self.write_chunk(first_chunk)
+                for chunk in chunks:
+                    self.write_chunk(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                print("客户端已断开，停止流式输出")
+                return
+            except Exception as e:
+                # 响应头已发出，不写结束块，客户端会得到不完整的响应
+                print(f"流式输出中断: {e}")
+                return
+            self.wfile.write(b'0\r\n\r\n')
+        finally:
+            # 提前结束时关闭生成器，释放服务端游标和数据库连接
+            chunks.close()
+    
+    def write_chunk(self, data):
+        if data:
+            self.wfile.write(f'{len(data):X}\r\n'.encode('ascii') + data + b'\r\n')
 
     def generate_random_date(self):
         """生成随机日期"""
@@ -795,40 +2881,404 @@ class ReportSystemHandler(http.server.SimpleHTTPRequestHandler):
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match')
         self.end_headers()
 
     def send_recycling_report(self):
         """返回服务版使用统计报表页面"""
+        self.send_page('recycling.html')
+
+    def send_page(self, name):
+        """返回程序目录下的HTML页面（内存缓存，脚本引用为带指纹的URL）；每次请求用ETag校验，页面未修改时返回304"""
         try:
-            file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recycling.html')
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(content.encode('utf-8'))
-        except FileNotFoundError:
-            self.send_response(404)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write('<h1>404 - 服务版报表页面未找到</h1>'.encode('utf-8'))
+            content = static_assets.render_page(name)
+            if content is None:
+                self.send_response(404)
+                self.send_header('Content-type', 'text/html; charset=utf-8')
+                self.end_headers()
+                self.wfile.write('<h1>404 - 页面未找到</h1>'.encode('utf-8'))
+                return
+            self.send_body(content, 'text/html; charset=utf-8')
         except Exception as e:
+            self.log_message(f'Error serving {name}: {str(e)}')
             self.send_response(500)
-            self.send_header('Content-type', 'text/html')
+            self.send_header('Content-type', 'text/html; charset=utf-8')
             self.end_headers()
             self.wfile.write(f'<h1>500 - 服务器内部错误: {str(e)}</h1>'.encode('utf-8'))
 
-class ThreadedHTTPServer(ThreadingMixIn, socketserver.TCPServer):
-    daemon_threads = True
+# 请求处理线程池：固定SERVER_THREADS个线程，等待处理的连接最多SERVER_QUEUE_SIZE个，
+# 队列已满时直接返回503并带Retry-After
+SERVER_THREADS = int(os.getenv('SERVER_THREADS', '32'))
+SERVER_QUEUE_SIZE = int(os.getenv('SERVER_QUEUE_SIZE', '128'))
+RETRY_AFTER = os.getenv('RETRY_AFTER', '5')
+
+def overloaded_body():
+    return json.dumps({'error': '服务繁忙，请稍后重试'}, ensure_ascii=False).encode('utf-8')
+
+class ThreadedHTTPServer(socketserver.TCPServer):
+    """用固定大小的线程池处理连接：接受的连接先放入有界队列，由工作线程依次处理；
+    记录队列长度、排队等待时间及因队列已满被拒绝的连接数"""
+    allow_reuse_address = True
+    current = None  # 本进程中正在运行的服务，供/api/cache/stats读取统计
+
+    def __init__(self, server_address, handler, bind_and_activate=True, threads=None, queue_size=None):
+        super().__init__(server_address, handler, bind_and_activate)
+        self.pending = queue.Queue(maxsize=queue_size or SERVER_QUEUE_SIZE)
+        self.lock = threading.Lock()
+        self.idle = threading.Condition(self.lock)
+        self.active = 0  # 排队中和处理中的连接数
+        self.busy = 0
+        self.handled = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.workers = [threading.Thread(target=self.process_queue, daemon=True, name=f'http-worker-{i}')
+                        for i in range(threads or SERVER_THREADS)]
+        for worker in self.workers:
+            worker.start()
+        reserved = sum(ENDPOINT_LIMITS.values()) + ENDPOINT_QUEUE * len(ENDPOINT_LIMITS)
+        if reserved >= len(self.workers):
+            print(f"警告: 耗时接口并发上限与等待数之和({reserved})不小于请求线程数({len(self.workers)})，"
+                  f"轻量请求可能排队，请调整ENDPOINT_LIMITS/ENDPOINT_QUEUE/SERVER_THREADS")
+        ThreadedHTTPServer.current = self
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.active += 1
+        try:
+            self.pending.put_nowait((request, client_address, time.monotonic()))
+        except queue.Full:
+            self.reject(request)
+
+    def reject(self, request):
+        """队列已满：不读取请求，直接返回503"""
+        body = overloaded_body()
+        try:
+            request.sendall(
+                b'HTTP/1.0 503 Service Unavailable\r\n'
+                b'Content-Type: application/json; charset=utf-8\r\n'
+                b'Access-Control-Allow-Origin: *\r\n'
+                + f'Retry-After: {RETRY_AFTER}\r\nContent-Length: {len(body)}\r\n'.encode('ascii')
+                + b'Connection: close\r\n\r\n' + body)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+        with self.lock:
+            self.rejected += 1
+        self.request_done()
+
+    def process_queue(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            request, client_address, queued_at = item
+            waited = time.monotonic() - queued_at
+            with self.lock:
+                self.busy += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                with self.lock:
+                    self.busy -= 1
+                    self.handled += 1
+                self.request_done()
+
+    def request_done(self):
+        with self.lock:
+            self.active -= 1
+            self.idle.notify_all()
+
+    def drain(self, timeout):
+        """等待排队中和处理中的请求完成，超时返回False"""
+        with self.lock:
+            return self.idle.wait_for(lambda: self.active == 0, timeout)
+
+    def server_close(self):
+        super().server_close()
+        for _ in self.workers:
+            try:
+                self.pending.put_nowait(None)
+            except queue.Full:
+                break
+
+    def stats(self):
+        with self.lock:
+            started = self.handled + self.busy
+            return {
+                'threads': len(self.workers),
+                'busy': self.busy,
+                'queue_depth': self.pending.qsize(),
+                'queue_size': self.pending.maxsize,
+                'handled': self.handled,
+                'rejected': self.rejected,
+                'avg_wait_ms': round(self.wait_total / started * 1000, 3) if started else 0,
+                'max_wait_ms': round(self.wait_max * 1000, 3),
+            }
+
+# 预派生多进程模式（--legacy --workers N）：SIGTERM后等待处理中请求完成的最长时间（秒）；
+# PREFORK_REUSEPORT=1时各工作进程用SO_REUSEPORT各自监听端口，否则共用父进程创建的监听socket
+PREFORK_DRAIN_TIMEOUT = float(os.getenv('PREFORK_DRAIN_TIMEOUT', '30'))
+PREFORK_REUSEPORT = os.getenv('PREFORK_REUSEPORT', '0') == '1'
+
+class PreforkWorkerServer(ThreadedHTTPServer):
+    """预派生工作进程中的服务：使用已监听的socket"""
+
+    def __init__(self, sock, handler):
+        super().__init__(sock.getsockname(), handler, bind_and_activate=False)
+        self.socket.close()
+        self.socket = sock
+
+def run_prefork_worker(sock, index):
+    """工作进程：处理请求直到收到SIGTERM，然后停止接受新连接并排空处理中的请求"""
+    httpd = PreforkWorkerServer(sock, ReportSystemHandler)
+    # shutdown()会等待serve_forever退出，不能在信号处理函数所在的主线程中直接调用
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=httpd.shutdown, daemon=True).start())
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C由主进程统一处理
+    signal.signal(signal.SIGALRM, signal.SIG_DFL)
+    print(f"工作进程{index}已启动 (pid {os.getpid()})")
+    if report_warmer.interval > 0:
+        report_warmer.start()
+    metric_shards.start()
+    httpd.serve_forever()
+    httpd.socket.close()
+    drained = httpd.drain(PREFORK_DRAIN_TIMEOUT)
+    if not drained:
+        print(f"工作进程{index}: {PREFORK_DRAIN_TIMEOUT}秒内仍有{httpd.active}个请求未完成，强制退出")
+    report_warmer.stop()
+    metric_shards.stop()
+    db_pool.close()
+    return 0 if drained else 1
+
+class PreforkSupervisor:
+    """预派生多个工作进程共同监听同一端口，工作进程异常退出时重新启动；
+    收到SIGTERM/SIGINT后通知所有工作进程排空并退出，超时未退出的强制结束"""
+
+    def __init__(self, address, workers, reuse_port=PREFORK_REUSEPORT, drain_timeout=PREFORK_DRAIN_TIMEOUT):
+        self.address = address
+        self.workers = workers
+        self.reuse_port = reuse_port
+        self.drain_timeout = drain_timeout
+        self.socket = None
+        self.children = {}  # pid -> 工作进程序号
+        self.started = {}  # 工作进程序号 -> 启动时间
+        self.stopping = False
+        self.restarts = 0
+
+    def listen(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(self.address)
+        sock.listen(ThreadedHTTPServer.request_queue_size)
+        return sock
+
+    def spawn(self, index):
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                status = run_prefork_worker(self.socket or self.listen(), index)
+            finally:
+                os._exit(status)
+        self.children[pid] = index
+        self.started[index] = time.time()
+
+    def stop(self, signum, frame):
+        if self.stopping:
+            return
+        self.stopping = True
+        print(f"收到停止信号，等待{len(self.children)}个工作进程完成处理中的请求")
+        # 关闭主进程持有的监听socket，工作进程也关闭后不再接受新连接
+        if self.socket is not None:
+            self.socket.close()
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        signal.alarm(int(self.drain_timeout) + 5)
+
+    def kill_remaining(self, signum, frame):
+        for pid in list(self.children):
+            print(f"工作进程(pid {pid})未按时退出，强制结束")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        if not self.reuse_port:
+            self.socket = self.listen()
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGALRM, self.kill_remaining)
+        for index in range(self.workers):
+            self.spawn(index)
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index = self.children.pop(pid, None)
+            if index is None or self.stopping:
+                continue
+            print(f"工作进程{index}(pid {pid})异常退出(状态{status})，重新启动")
+            self.restarts += 1
+            # 启动后立即退出的进程延迟重启，避免反复fork
+            if time.time() - self.started[index] < 1:
+                time.sleep(1)
+            self.spawn(index)
+
+# 报表查询依赖的索引: (索引名, 表名, 列)
+REPORT_INDEXES = [
+    ('idx_lot_state_event_time', 'lot', ('lot_state', 'event_time')),
+    ('idx_aoi_field_order_station', 'analyze_aoi_field', ('order_no', 'process_flow_seq_name')),
+    ('idx_aoi_field_item_af_kind', 'analyze_aoi_field_item', ('af_id', 'kind')),
+    ('idx_lot_engineer_setting_lot_seq', 'lot_engineer_setting', ('lot_name', 'process_seq_name')),
+    ('idx_lot_history_lot_seq_state_time', 'lot_history', ('lot_name', 'process_seq_name', 'lot_process_state', 'event_time')),
+    ('idx_erp_cam_design_param_lot_htm', 'erp_cam_design_param', ('lot_name', 'htm_no')),
+    # 回收版筛选条件
+    ('idx_lot_event_time_lot_name', 'lot', ('event_time', 'lot_name')),  # 同时是分页排序键
+    ('idx_lot_customer_event_time', 'lot', ('customer_name', 'event_time')),
+    ('idx_lot_type_event_time', 'lot', ('lot_type', 'event_time')),
+    ('idx_lot_material_def_event_time', 'lot', ('material_def_id', 'event_time')),
+    ('idx_lot_name_pattern', 'lot', ('lot_name text_pattern_ops',)),
+    ('idx_lot_material_id_pattern', 'lot', ('material_id text_pattern_ops',)),
+]
+
+def find_covering_index(cur, table, columns):
+    """查找以指定列为前缀的已有索引，返回索引名或None；列可写成"列名 操作符类"，此时操作符类也须一致。
+    创建失败留下的无效索引(indisvalid为false)和部分索引不算在内"""
+    cur.execute("""
+        SELECT i.relname AS index_name,
+               ARRAY(
+                   SELECT a.attname::text
+                   FROM unnest(x.indkey) WITH ORDINALITY AS k(attnum, ord)
+                   JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+                   ORDER BY k.ord
+               ) AS columns,
+               ARRAY(
+                   SELECT opc.opcname::text
+                   FROM unnest(x.indclass::oid[]) WITH ORDINALITY AS c(opclass, ord)
+                   JOIN pg_opclass opc ON opc.oid = c.opclass
+                   ORDER BY c.ord
+               ) AS opclasses
+        FROM pg_index x
+        JOIN pg_class t ON t.oid = x.indrelid
+        JOIN pg_class i ON i.oid = x.indexrelid
+        WHERE t.relname = %s AND pg_table_is_visible(t.oid)
+            AND x.indisvalid AND x.indpred IS NULL
+    """, (table,))
+    wanted = [column.split() for column in columns]
+    for index_name, index_columns, index_opclasses in cur.fetchall():
+        if len(index_columns) < len(wanted):
+            continue
+        if all(index_columns[i] == spec[0] and (len(spec) == 1 or index_opclasses[i] == spec[1])
+               for i, spec in enumerate(wanted)):
+            return index_name
+    return None
+
+def ensure_indexes():
+    """创建或校验报表查询所需的索引，并打印各接口查询的执行计划"""
+    # 单独建立连接，不使用连接池的会话参数：大表上CREATE INDEX CONCURRENTLY可能超过statement_timeout，
+    # 被取消后会留下无效索引
+    conn = get_db_connection()
+    if not conn:
+        raise SystemExit("数据库连接失败")
+    conn.autocommit = True  # CREATE INDEX CONCURRENTLY不能在事务中执行
+    cur = conn.cursor()
+    try:
+        cur.execute("SET statement_timeout = 0")
+        for index_name, table, columns in REPORT_INDEXES:
+            existing = find_covering_index(cur, table, columns)
+            if existing:
+                print(f"[已存在] {table}({', '.join(columns)}) -> {existing}")
+                continue
+            # 之前CREATE INDEX CONCURRENTLY中断会留下同名的无效索引，IF NOT EXISTS会跳过它，需先删除
+            cur.execute("SELECT 1 FROM pg_class i JOIN pg_index x ON x.indexrelid = i.oid "
+                        "WHERE i.relname = %s AND pg_table_is_visible(i.oid) AND NOT x.indisvalid", (index_name,))
+            if cur.fetchone():
+                print(f"[删除无效索引] {index_name}")
+                cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+            print(f"[创建中] {table}({', '.join(columns)}) -> {index_name}")
+            cur.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} ({', '.join(columns)})")
+            cur.execute(f"ANALYZE {table}")
+
+        # 打印各接口查询的执行计划，便于发现计划退化（如回退为全表扫描或全量排序）
+        year = datetime.now().year
+        recycling = {'year': year}
+        where, count_params = recycling_where(recycling)
+        # 年中位置的游标：深页应与第一页一样从索引中间开始读取
+        cursor = encode_recycling_cursor({'repairtime': datetime(year, 7, 1), 'lot_name': ''})
+        queries = [
+            ('/api/report', IQC_REPORT_SQL, period_params([year_range(year)])),
+            ('/api/report (多年份/日期区间)', IQC_REPORT_SQL, period_params([year_range(year - 1), year_range(year)])),
+            ('/api/report 当年缓存指纹', SHIPPED_FINGERPRINT_SQL, year_range(year)),
+            ('/api/years 出货时间范围', SHIPPED_BOUNDS_SQL, None),
+            ('/api/years 各年份lot数', YEAR_LOT_COUNTS_SQL, (year - 1, year)),
+            ('/api/recycling (全部/流式/导出)', *build_recycling_query(recycling)),
+            ('/api/recycling 第一页', *build_recycling_query(recycling, 11)),
+            ('/api/recycling 游标分页', *build_recycling_query(recycling, 11, cursor)),
+            ('/api/recycling total=1', RECYCLING_COUNT_SQL + where, count_params),
+            ('/api/recycling/summary', *build_recycling_summary_query(recycling)),
+            ('/api/recycling/facets', *build_recycling_facets_query(recycling)),
+        ]
+        for endpoint, sql, params in queries:
+            print(f"\n===== {endpoint} 执行计划 =====")
+            cur.execute("EXPLAIN " + sql.strip().rstrip(';'), params)
+            for (line,) in cur.fetchall():
+                print(line)
+    finally:
+        cur.close()
+        conn.close()
 
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='报表系统服务器')
+    parser.add_argument('--ensure-indexes', action='store_true', help='创建/校验报表查询所需索引并打印执行计划后退出')
+    parser.add_argument('--refresh-aggregates', action='store_true', help='将已关闭月份写入IQC本地月度汇总库后退出')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('SERVER_WORKERS', '1')), help='工作进程数（ASGI模式为uvicorn工作进程，--legacy时为预派生进程）')
+    parser.add_argument('--legacy', action='store_true', help='使用旧的http.server服务（ReportSystemHandler）代替ASGI应用')
+    args = parser.parse_args()
+
+    if args.ensure_indexes:
+        ensure_indexes()
+        raise SystemExit(0)
+    if args.refresh_aggregates:
+        iqc_aggregate_store.refresh()
+        raise SystemExit(0)
+
     PORT = 8003
+    metric_shards.clear()
+    if not args.legacy:
+        import uvicorn
+        os.chdir(STATIC_ROOT)  # 工作进程按模块名导入asgi_app
+        print(f"服务器运行在 http://localhost:{PORT}（ASGI，{args.workers}个工作进程）")
+        uvicorn.run('asgi_app:app', host='0.0.0.0', port=PORT, workers=args.workers)
+        raise SystemExit(0)
+
+    if args.workers > 1:
+        print(f"服务器运行在 http://localhost:{PORT}（{args.workers}个预派生工作进程）")
+        PreforkSupervisor(('', PORT), args.workers).run()
+        print("\n服务器已停止")
+        raise SystemExit(0)
+
     Handler = ReportSystemHandler
     with ThreadedHTTPServer(('', PORT), Handler) as httpd:
         print(f"服务器运行在 http://localhost:{PORT}")
         print("按 Ctrl+C 停止服务器")
+        if report_warmer.interval > 0:
+            report_warmer.start()
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
+            report_warmer.stop()
+            db_pool.close()
             print("\n服务器已停止")
\ No newline at end of file